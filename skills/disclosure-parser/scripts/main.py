@@ -122,7 +122,7 @@ def _write_pdf_outputs(
     return saved_files
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     """Run parser CLI."""
     parser = argparse.ArgumentParser(
         description="Parse EDINET XBRL zip files or PDF securities reports into normalized BS/PL/CF JSON."
@@ -152,7 +152,7 @@ def main() -> int:
         default=False,
         help="Force PDF parsing mode (uses pdf_parser.py instead of parser.py).",
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     try:
         code = resolve_code(args.code, args.ticker)
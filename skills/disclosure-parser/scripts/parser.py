@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from functools import lru_cache
+from itertools import repeat
 import json
 import logging
 from pathlib import Path
 import re
-from typing import Iterable, cast
+from typing import IO, Iterable, cast
 import zipfile
 
 from lxml import etree
@@ -125,7 +128,7 @@ class ContextInfo:
         return "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class PeriodFinancial:
     """Financial values grouped by comparable period end date."""
 
@@ -216,7 +219,7 @@ class PeriodFinancial:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedDocument:
     """Parsed result per EDINET zip."""
 
@@ -331,38 +334,44 @@ def fiscal_year_from_period_end(period_end: str) -> int | None:
         return None
 
 
-def parse_contexts(root: etree._Element) -> dict[str, ContextInfo]:
-    """Build context lookup table from XBRL root."""
-    contexts: dict[str, ContextInfo] = {}
-    for context in root.xpath(".//*[local-name()='context']"):
-        context_id = context.get("id")
-        if context_id is None:
-            continue
+# Compiled once: an ``etree.XPath`` keeps its parsed expression, whereas
+# ``element.xpath(str)`` recompiles on every call. ``local-name()`` keeps the
+# queries independent of the taxonomy-dated namespace URIs.
+_XP_PERIOD = etree.XPath("./*[local-name()='period']")
+_XP_INSTANT = etree.XPath("./*[local-name()='instant']")
+_XP_START_DATE = etree.XPath("./*[local-name()='startDate']")
+_XP_END_DATE = etree.XPath("./*[local-name()='endDate']")
 
-        period_elements: list[etree._Element] = context.xpath("./*[local-name()='period']")
-        if not period_elements:
-            continue
-        period = period_elements[0]
-
-        instant = _first_text(period.xpath("./*[local-name()='instant']"))
-        start_date = _first_text(period.xpath("./*[local-name()='startDate']"))
-        end_date = _first_text(period.xpath("./*[local-name()='endDate']"))
-
-        if instant is not None:
-            period_type = "instant"
-        elif start_date is not None or end_date is not None:
-            period_type = "duration"
-        else:
-            period_type = "unknown"
-
-        contexts[context_id] = ContextInfo(
-            context_id=context_id,
-            period_type=period_type,
-            start_date=start_date,
-            end_date=end_date,
-            instant_date=instant,
-        )
-    return contexts
+
+def _context_info(context: etree._Element) -> ContextInfo | None:
+    """Build ContextInfo from a single ``xbrli:context`` element."""
+    context_id = context.get("id")
+    if context_id is None:
+        return None
+
+    period_elements = cast(list[etree._Element], _XP_PERIOD(context))
+    if not period_elements:
+        return None
+    period = period_elements[0]
+
+    instant = _first_text(_XP_INSTANT(period))
+    start_date = _first_text(_XP_START_DATE(period))
+    end_date = _first_text(_XP_END_DATE(period))
+
+    if instant is not None:
+        period_type = "instant"
+    elif start_date is not None or end_date is not None:
+        period_type = "duration"
+    else:
+        period_type = "unknown"
+
+    return ContextInfo(
+        context_id=context_id,
+        period_type=period_type,
+        start_date=start_date,
+        end_date=end_date,
+        instant_date=instant,
+    )
 
 
 def _first_text(elements: Iterable[etree._Element]) -> str | None:
@@ -375,24 +384,109 @@ def _first_text(elements: Iterable[etree._Element]) -> str | None:
     return None
 
 
-def _choose_xbrl_member(zip_file: zipfile.ZipFile) -> str:
+def _xbrl_member_rank(info: zipfile.ZipInfo) -> tuple[bool, int, str]:
+    name = info.filename.lower()
+    return ("publicdoc" not in name, len(name), name)
+
+
+def _choose_xbrl_member(zip_file: zipfile.ZipFile) -> zipfile.ZipInfo:
+    """Pick the XBRL member in one pass over the central directory."""
     xbrl_candidates = [
-        name
-        for name in zip_file.namelist()
-        if name.lower().endswith(".xbrl") and not name.endswith("/")
+        info
+        for info in zip_file.infolist()
+        if info.filename.lower().endswith(".xbrl") and not info.is_dir()
     ]
     if not xbrl_candidates:
         raise ParserError("No .xbrl member found in zip archive.")
 
-    preferred = sorted(
-        xbrl_candidates,
-        key=lambda name: (
-            "publicdoc" not in name.lower(),
-            len(name),
-            name.lower(),
-        ),
-    )
-    return preferred[0]
+    return min(xbrl_candidates, key=_xbrl_member_rank)
+
+
+@dataclass(frozen=True)
+class _Fact:
+    """A relevant XBRL fact captured during the streaming pass."""
+
+    context_id: str
+    normalized_concept: str
+    canonical: str | None
+    text: str
+    sign: str | None
+
+
+def _release(element: etree._Element) -> None:
+    """Free a consumed element (and its consumed top-level predecessors)."""
+    element.clear(keep_tail=True)
+    parent = element.getparent()
+    if parent is not None and parent.getparent() is None:
+        while element.getprevious() is not None:
+            del parent[0]
+
+
+@lru_cache(maxsize=4096)
+def _relevant_concept(tag: str) -> tuple[str, str | None] | None:
+    """Resolve a fact tag to ``(normalized_concept, canonical)`` once per tag.
+
+    Filings repeat the same few hundred tags across thousands of facts
+    (segments, prior years, notes), so irrelevant tags are rejected with a
+    cache hit instead of a QName split, regex normalization and alias lookup.
+    """
+    normalized_concept = normalize_identifier(etree.QName(tag).localname)
+    canonical = CONCEPT_ALIAS_LOOKUP.get(normalized_concept)
+    if canonical is None and normalized_concept not in COMPANY_NAME_CONCEPTS:
+        return None
+    return normalized_concept, canonical
+
+
+def _scan_xbrl(source: IO[bytes]) -> tuple[dict[str, ContextInfo], list[_Fact]]:
+    """Single iterparse pass collecting contexts and mapped facts.
+
+    Facts are kept in document order (``set_metric`` lets later facts of
+    equal priority win) and only when they map to a canonical key or a
+    company-name concept, so the full tree is never materialized.
+    """
+    contexts: dict[str, ContextInfo] = {}
+    facts: list[_Fact] = []
+
+    for _, element in etree.iterparse(
+        source,
+        events=("end",),
+        resolve_entities=False,
+        no_network=True,
+        load_dtd=False,
+        recover=False,
+        huge_tree=False,
+    ):
+        if not isinstance(element.tag, str):
+            continue
+        context_id = element.get("contextRef")
+        if context_id is None:
+            if etree.QName(element).localname == "context":
+                info = _context_info(element)
+                if info is not None:
+                    contexts[info.context_id] = info
+                _release(element)
+            continue
+
+        concept = _relevant_concept(element.tag)
+        if concept is None:
+            _release(element)
+            continue
+
+        normalized_concept, canonical = concept
+        text = (element.text or "").strip()
+        if text:
+            facts.append(
+                _Fact(
+                    context_id=context_id,
+                    normalized_concept=normalized_concept,
+                    canonical=canonical,
+                    text=text,
+                    sign=element.get("sign"),
+                )
+            )
+        _release(element)
+
+    return contexts, facts
 
 
 def parse_edinet_zip(zip_path: Path, ticker: str) -> ParsedDocument:
@@ -400,60 +494,38 @@ def parse_edinet_zip(zip_path: Path, ticker: str) -> ParsedDocument:
     if not zip_path.exists():
         raise ParserError(f"Zip file not found: {zip_path}")
 
+    # The XBRL member is decompressed incrementally while iterparse consumes
+    # it, so neither the inflated bytes nor the full tree are held at once.
     try:
         with zipfile.ZipFile(zip_path) as archive:
-            member_name = _choose_xbrl_member(archive)
-            xbrl_bytes = archive.read(member_name)
+            member = _choose_xbrl_member(archive)
+            with archive.open(member) as xbrl_stream:
+                contexts, facts = _scan_xbrl(xbrl_stream)
     except zipfile.BadZipFile as exc:
         raise ParserError(f"Invalid zip file: {zip_path}") from exc
-    except OSError as exc:
-        raise ParserError(f"Failed reading zip file: {zip_path}") from exc
-
-    try:
-        root = etree.fromstring(
-            xbrl_bytes,
-            parser=etree.XMLParser(
-                resolve_entities=False,
-                no_network=True,
-                load_dtd=False,
-                recover=False,
-                huge_tree=False,
-            ),
-        )
     except etree.XMLSyntaxError as exc:
         raise ParserError(f"Invalid XBRL XML in {zip_path.name}") from exc
+    except OSError as exc:
+        raise ParserError(f"Failed reading zip file: {zip_path}") from exc
 
-    contexts = parse_contexts(root)
     periods: dict[str, PeriodFinancial] = {}
     company_name: str | None = None
 
-    for element in root.xpath(".//*[@contextRef]"):
-        context_id = element.get("contextRef")
-        if context_id is None:
-            continue
-        context = contexts.get(context_id)
+    for fact in facts:
+        context = contexts.get(fact.context_id)
         if context is None:
             continue
 
-        try:
-            concept_local_name = etree.QName(element).localname
-        except ValueError:
-            continue
-        normalized_concept = normalize_identifier(concept_local_name)
-
-        text = (element.text or "").strip()
-        if not text:
-            continue
-
-        if company_name is None and normalized_concept in COMPANY_NAME_CONCEPTS:
+        text = fact.text
+        if company_name is None and fact.normalized_concept in COMPANY_NAME_CONCEPTS:
             company_name = text
 
-        canonical = canonical_key_for_concept(concept_local_name)
+        canonical = fact.canonical
         if canonical is None:
             continue
 
         statement = CONCEPT_TO_STATEMENT[canonical]
-        value = parse_numeric_value(text, element.get("sign"))
+        value = parse_numeric_value(text, fact.sign)
         if value is None:
             continue
 
@@ -520,7 +592,7 @@ def _deduplicate_corrections(zip_files: list[Path]) -> list[Path]:
             ungrouped.append(zp)
             continue
 
-        fname = Path(member).name
+        fname = Path(member.filename).name
         match = _XBRL_VERSION_PATTERN.search(fname)
         if not match:
             ungrouped.append(zp)
@@ -543,10 +615,22 @@ def _deduplicate_corrections(zip_files: list[Path]) -> list[Path]:
     return sorted(result)
 
 
-def parse_edinet_directory(input_dir: Path, ticker: str) -> list[ParsedDocument]:
+# Below this many zips, process start-up costs more than the parse itself.
+PARALLEL_MIN_ZIPS = 4
+
+
+def parse_edinet_directory(
+    input_dir: Path,
+    ticker: str,
+    workers: int = 1,
+) -> list[ParsedDocument]:
     """Parse all EDINET zip files under input_dir.
 
     Corrections (higher version numbers) supersede their originals.
+    Zips are parsed sequentially by default.  Each zip is an independent
+    CPU-bound parse, so callers may pass ``workers > 1`` to fan them out to
+    a process pool of that size (used only with at least
+    ``PARALLEL_MIN_ZIPS`` files).  Document order is preserved either way.
     """
     zip_files = sorted(input_dir.glob("*.zip"))
     if not zip_files:
@@ -554,10 +638,14 @@ def parse_edinet_directory(input_dir: Path, ticker: str) -> list[ParsedDocument]
 
     zip_files = _deduplicate_corrections(zip_files)
 
-    documents: list[ParsedDocument] = []
-    for zip_file in zip_files:
-        documents.append(parse_edinet_zip(zip_file, ticker=ticker))
-    return documents
+    workers = min(len(zip_files), workers)
+    if len(zip_files) < PARALLEL_MIN_ZIPS or workers < 2:
+        return [parse_edinet_zip(zip_file, ticker=ticker) for zip_file in zip_files]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(parse_edinet_zip, zip_files, repeat(ticker, len(zip_files)))
+        )
 
 
 def build_period_index(documents: list[ParsedDocument]) -> list[dict[str, object]]:
@@ -614,6 +702,13 @@ def _merge_statement(
             destination[key] = value
 
 
+def _write_json(path: Path, payload: object) -> None:
+    # Stream into a large write buffer: no full-payload string is built, and
+    # json.dump's many small chunks still reach the disk in few writes.
+    with path.open("w", encoding="utf-8", buffering=1 << 16) as file:
+        json.dump(payload, file, ensure_ascii=False, indent=2)
+
+
 def write_outputs(
     documents: list[ParsedDocument],
     output_dir: Path,
@@ -623,10 +718,10 @@ def write_outputs(
     output_dir.mkdir(parents=True, exist_ok=True)
 
     saved_files: dict[str, str] = {}
-    for document in documents:
+    document_dicts = [document.to_dict() for document in documents]
+    for document, document_dict in zip(documents, document_dicts):
         path = output_dir / f"{document.document_id}.json"
-        with path.open("w", encoding="utf-8") as file:
-            json.dump(document.to_dict(), file, ensure_ascii=False, indent=2)
+        _write_json(path, document_dict)
         saved_files[document.document_id] = str(path)
 
     aggregate_path = output_dir / "financials.json"
@@ -634,7 +729,7 @@ def write_outputs(
         "ticker": ticker,
         "generated_at": datetime.now(UTC).isoformat(),
         "document_count": len(documents),
-        "documents": [document.to_dict() for document in documents],
+        "documents": document_dicts,
         "period_index": build_period_index(documents),
         "schema": {
             "bs": list(BS_KEYS),
@@ -642,8 +737,7 @@ def write_outputs(
             "cf": list(CF_KEYS),
         },
     }
-    with aggregate_path.open("w", encoding="utf-8") as file:
-        json.dump(aggregate, file, ensure_ascii=False, indent=2)
+    _write_json(aggregate_path, aggregate)
     saved_files["financials"] = str(aggregate_path)
 
     return saved_files
@@ -7,12 +7,21 @@ the same ParsedDocument / PeriodFinancial output as the XBRL parser.
 from __future__ import annotations
 
 import calendar
+import hashlib
 import json
 import logging
+import os
+import pickle
 import re
+import tempfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
+from typing import Iterator
 
 import pdfplumber
 
@@ -43,6 +52,7 @@ DEFAULT_MULTIPLIER = 1_000_000
 DEFAULT_UNIT_LABEL = "百万円（デフォルト）"
 
 
+@lru_cache(maxsize=512)
 def detect_unit(text: str) -> tuple[int, str]:
     """Detect monetary unit from text near a table.
 
@@ -59,10 +69,11 @@ def detect_unit(text: str) -> tuple[int, str]:
 # ---------------------------------------------------------------------------
 
 _FOOTNOTE_RE = re.compile(r"※[０-９]*[,、]?\s*")
-_FULLWIDTH_MINUS = re.compile(r"[－﹣−‐]")
-_PAREN_NEG_RE = re.compile(r"^[（(]\s*(.+?)\s*[）)]$")
-_TRIANGLE_RE = re.compile(r"^[△▲]\s*")
-_COMMA_RE = re.compile(r",")
+_PAREN_OPEN = ("(", "（")
+_PAREN_CLOSE = (")", "）")
+_TRIANGLES = ("△", "▲")
+# Single str.translate pass: fullwidth/typographic minus → "-", drop commas.
+_NUMERIC_TRANSLATION = str.maketrans({"－": "-", "﹣": "-", "−": "-", "‐": "-", ",": None})
 _EMPTY_VALUES = {"", "-", "－", "―", "—", "−", "–"}
 
 
@@ -75,27 +86,27 @@ def normalize_value(raw: str | None, multiplier: int = 1) -> int | None:
         return None
 
     text = raw.strip()
-    text = _FOOTNOTE_RE.sub("", text).strip()
+    if "※" in text:
+        text = _FOOTNOTE_RE.sub("", text).strip()
 
     if text in _EMPTY_VALUES:
         return None
 
     negative = False
-    m = _PAREN_NEG_RE.match(text)
-    if m:
-        text = m.group(1)
+    if len(text) > 2 and text.startswith(_PAREN_OPEN) and text.endswith(_PAREN_CLOSE):
+        text = text[1:-1].strip()
         negative = True
 
-    if _TRIANGLE_RE.match(text):
-        text = _TRIANGLE_RE.sub("", text)
+    if text.startswith(_TRIANGLES):
+        text = text[1:].lstrip()
         negative = True
 
-    text = _FULLWIDTH_MINUS.sub("-", text)
+    text = text.translate(_NUMERIC_TRANSLATION)
     if text.startswith("-"):
         text = text[1:]
         negative = True
 
-    text = _COMMA_RE.sub("", text).strip()
+    text = text.strip()
 
     if not text:
         return None
@@ -164,21 +175,12 @@ _ERA_OFFSETS: dict[str, int] = {
     "昭和": 1925,
 }
 
-# Western calendar: 2024年３月31日
-_WESTERN_DATE_RE = re.compile(
-    r"(\d{4})\s*年\s*(\d{1,2})\s*月\s*(\d{1,2})\s*日"
-)
-# Japanese era: 平成27年３月31日
-_ERA_DATE_RE = re.compile(
-    r"(令和|平成|昭和)\s*(\d{1,2})\s*年\s*(\d{1,2})\s*月\s*(\d{1,2})\s*日"
-)
-
-_INSTANT_DATE_RE = _WESTERN_DATE_RE
-_DURATION_START_RE = re.compile(
-    r"自\s*(?:(\d{4})\s*年|(令和|平成|昭和)\s*(\d{1,2})\s*年)\s*(\d{1,2})\s*月\s*(\d{1,2})\s*日"
-)
-_DURATION_END_RE = re.compile(
-    r"至\s*(?:(\d{4})\s*年|(令和|平成|昭和)\s*(\d{1,2})\s*年)\s*(\d{1,2})\s*月\s*(\d{1,2})\s*日"
+# One pass per header: optional 自/至 marker, then a Western (2024年３月31日)
+# or Japanese era (平成27年３月31日) date.
+_HEADER_DATE_RE = re.compile(
+    r"(?P<marker>[自至])?\s*"
+    r"(?:(?P<year>\d{4})|(?P<era>令和|平成|昭和)\s*(?P<era_year>\d{1,2}))"
+    r"\s*年\s*(?P<month>\d{1,2})\s*月\s*(?P<day>\d{1,2})\s*日"
 )
 
 
@@ -186,42 +188,20 @@ def _era_to_western(era: str, era_year: int) -> int:
     return _ERA_OFFSETS.get(era, 0) + era_year
 
 
-def _parse_date_from_text(text: str) -> str | None:
-    """Parse a single date (Western or era) from text and return ISO format."""
-    m = _WESTERN_DATE_RE.search(text)
-    if m:
-        return f"{m.group(1)}-{int(m.group(2)):02d}-{int(m.group(3)):02d}"
-
-    m = _ERA_DATE_RE.search(text)
-    if m:
-        year = _era_to_western(m.group(1), int(m.group(2)))
-        return f"{year}-{int(m.group(3)):02d}-{int(m.group(4)):02d}"
-
-    return None
-
-
-def _parse_duration_start(text: str) -> str | None:
-    """Parse 自 YYYY年M月D日 or 自 平成N年M月D日."""
-    m = _DURATION_START_RE.search(text)
-    if not m:
-        return None
-    if m.group(1):  # Western
-        year = int(m.group(1))
-    else:  # Era
-        year = _era_to_western(m.group(2), int(m.group(3)))
-    return f"{year}-{int(m.group(4)):02d}-{int(m.group(5)):02d}"
-
+def _iter_header_dates(text: str) -> Iterator[tuple[str | None, str, bool]]:
+    """Yield (marker, iso_date, is_era) for every date in *text*, in order.
 
-def _parse_duration_end(text: str) -> str | None:
-    """Parse 至 YYYY年M月D日 or 至 平成N年M月D日."""
-    m = _DURATION_END_RE.search(text)
-    if not m:
-        return None
-    if m.group(1):  # Western
-        year = int(m.group(1))
-    else:  # Era
-        year = _era_to_western(m.group(2), int(m.group(3)))
-    return f"{year}-{int(m.group(4)):02d}-{int(m.group(5)):02d}"
+    *marker* is "自", "至" or None.
+    """
+    for m in _HEADER_DATE_RE.finditer(text):
+        if m.group("year"):
+            year = m.group("year")
+            is_era = False
+        else:
+            year = str(_era_to_western(m.group("era"), int(m.group("era_year"))))
+            is_era = True
+        iso = f"{year}-{int(m.group('month')):02d}-{int(m.group('day')):02d}"
+        yield m.group("marker"), iso, is_era
 
 
 def _match_to_iso(m: re.Match[str]) -> str:
@@ -229,9 +209,12 @@ def _match_to_iso(m: re.Match[str]) -> str:
     return f"{year}-{int(month):02d}-{int(day):02d}"
 
 
-@dataclass
+@dataclass(frozen=True)
 class PeriodInfo:
-    """Parsed period metadata from a column header."""
+    """Parsed period metadata from a column header.
+
+    Frozen so that cached instances from parse_column_header can be shared.
+    """
 
     period_start: str | None
     period_end: str
@@ -239,6 +222,7 @@ class PeriodInfo:
     label: str  # "prior" or "current"
 
 
+@lru_cache(maxsize=4096)
 def parse_column_header(header_text: str) -> PeriodInfo | None:
     """Extract period information from a table column header.
 
@@ -251,8 +235,22 @@ def parse_column_header(header_text: str) -> PeriodInfo | None:
     if "前" in header_text:
         label = "prior"
 
-    start_date = _parse_duration_start(header_text)
-    end_date = _parse_duration_end(header_text)
+    # First 自 / 至 dates make a duration; otherwise the first Western date
+    # (or, failing that, the first era date) is an instant.
+    start_date: str | None = None
+    end_date: str | None = None
+    western_date: str | None = None
+    era_date: str | None = None
+    for marker, iso, is_era in _iter_header_dates(header_text):
+        if marker == "自" and start_date is None:
+            start_date = iso
+        elif marker == "至" and end_date is None:
+            end_date = iso
+        if is_era:
+            era_date = era_date or iso
+        else:
+            western_date = western_date or iso
+
     if start_date and end_date:
         return PeriodInfo(
             period_start=start_date,
@@ -261,7 +259,7 @@ def parse_column_header(header_text: str) -> PeriodInfo | None:
             label=label,
         )
 
-    instant_date = _parse_date_from_text(header_text)
+    instant_date = western_date or era_date
     if instant_date:
         return PeriodInfo(
             period_start=None,
@@ -343,7 +341,15 @@ _BS_EXACT_MATCH_ALIASES: frozenset[str] = frozenset(
     for alias in aliases
 )
 
+# Prefix-match candidates bucketed by first character (BS aliases excluded,
+# see map_concept).  Insertion order within a bucket follows _CONCEPT_LOOKUP.
+_PREFIX_BY_FIRST: dict[str, list[tuple[str, str]]] = {}
+for _alias, _canonical in _CONCEPT_LOOKUP.items():
+    if _alias not in _BS_EXACT_MATCH_ALIASES:
+        _PREFIX_BY_FIRST.setdefault(_alias[0], []).append((_alias, _canonical))
+
 
+@lru_cache(maxsize=4096)
 def map_concept(japanese_name: str) -> str | None:
     """Map a Japanese concept name to a canonical key.
 
@@ -352,6 +358,10 @@ def map_concept(japanese_name: str) -> str | None:
 
     BS aliases use exact match only to prevent false positives
     (e.g. "流動資産合計" prefix-matching "資産合計" → total_assets).
+
+    The same row labels are mapped repeatedly (scoring, supplementing and
+    building periods for every strategy), so results — including misses and
+    prefix hits — are memoized.
     """
     cleaned = japanese_name.strip()
     result = _CONCEPT_LOOKUP.get(cleaned)
@@ -360,9 +370,9 @@ def map_concept(japanese_name: str) -> str | None:
 
     # Prefix match: "親会社株主に帰属する当期純利益又は..." → net_income
     # Skip BS aliases to prevent total_assets false positives
-    for alias, canonical in _CONCEPT_LOOKUP.items():
-        if alias in _BS_EXACT_MATCH_ALIASES:
-            continue
+    if not cleaned:
+        return None
+    for alias, canonical in _PREFIX_BY_FIRST.get(cleaned[0], ()):
         if cleaned.startswith(alias):
             return canonical
 
@@ -556,15 +566,26 @@ STRATEGIES: list[dict] = [
      "settings": {"vertical_strategy": "text", "horizontal_strategy": "lines"}},
 ]
 
+# pdfplumber's default table settings are lines/lines, i.e. identical to S1.
+_DEFAULT_TABLE_SETTINGS: dict = STRATEGIES[0]["settings"]
+
+
+# Early-exit threshold for _try_strategies: the number of distinct canonical
+# concepts reachable for each statement type.  A strategy that finds all of
+# them cannot be beaten on score; it only ends the loop when its periods also
+# cover every populated value column (see _is_good_enough), because candidates
+# rank on period count before score.
+_GOOD_ENOUGH_SCORE: dict[str, int] = {
+    stmt: len({c for c in _CONCEPT_LOOKUP.values() if CONCEPT_TO_STATEMENT.get(c) == stmt})
+    for stmt in ("bs", "pl", "cf")
+}
+_GOOD_ENOUGH_MIN_PERIODS = 2
+
 
 def _concept_score(data_rows: list[list[str | None]]) -> int:
     """Count unique recognised financial concepts in data rows."""
-    found: set[str] = set()
-    for row in data_rows:
-        if row and row[0]:
-            c = map_concept((row[0] or "").strip())
-            if c is not None:
-                found.add(c)
+    found = {map_concept(row[0].strip()) for row in data_rows if row and row[0]}
+    found.discard(None)
     return len(found)
 
 
@@ -591,20 +612,105 @@ class _PageScan:
     statement_type: str
 
 
-def _scan_statement_headers(pdf: pdfplumber.PDF) -> list[_PageScan]:
-    """Pass 1: find pages with consolidated financial statement headers."""
+# Opt-in process parallelism for the header scan.  When this environment
+# variable is an integer >= 2, header scans of PDFs with at least
+# PARALLEL_SCAN_MIN_PAGES pages are split across that many worker processes;
+# otherwise (the default) pages are scanned sequentially in-process.
+SCAN_WORKERS_ENV = "PDF_PARSER_SCAN_WORKERS"
+PARALLEL_SCAN_MIN_PAGES = 40
+
+
+def _scan_workers() -> int:
+    """Return the configured header-scan worker count (1 = sequential)."""
+    configured = os.environ.get(SCAN_WORKERS_ENV, "")
+    try:
+        return max(int(configured), 1)
+    except ValueError:
+        return 1
+
+
+def _scan_pages(pages: list[pdfplumber.pdf.Page], offset: int) -> list[_PageScan]:
+    """Classify *pages* (starting at page index *offset*) by section header.
+
+    Each page's parsed layout is flushed once scanned so that memory stays
+    bounded on long reports; the few statement pages are re-parsed later.
+    """
     results: list[_PageScan] = []
-    for idx, page in enumerate(pdf.pages):
-        text = page.extract_text() or ""
+    for idx, page in enumerate(pages, start=offset):
+        text = page.extract_text_simple() or ""
+        page.flush_cache()
         stmt_type = classify_statement(text)
         if stmt_type is not None:
             results.append(_PageScan(page_idx=idx, page_num=idx + 1, statement_type=stmt_type))
     return results
 
 
-def _is_continuation_page(page: pdfplumber.pdf.Page, expected_cols: int) -> bool:
+def _scan_page_range(pdf_path: Path, start: int, stop: int) -> list[_PageScan]:
+    """Process-pool worker: scan pages [start, stop) of *pdf_path*."""
+    with pdfplumber.open(pdf_path) as pdf:
+        return _scan_pages(pdf.pages[start:stop], start)
+
+
+def _scan_statement_headers(
+    pdf: pdfplumber.PDF,
+    pdf_path: Path | None = None,
+) -> list[_PageScan]:
+    """Pass 1: find pages with consolidated financial statement headers.
+
+    Only literal 【...】 headers are searched here, so the cheap
+    ``extract_text_simple`` (line clustering without word/layout analysis)
+    is used instead of ``extract_text``.  Full-layout text is still
+    extracted for the statement pages in the later passes.
+
+    pdfplumber pages share one document handle and are not thread-safe, so
+    when ``PDF_PARSER_SCAN_WORKERS`` opts in, *pdf_path* is given and the
+    report is long, contiguous page ranges are scanned in separate processes
+    that each reopen the file.
+    """
+    page_count = len(pdf.pages)
+    workers = min(_scan_workers(), page_count // (PARALLEL_SCAN_MIN_PAGES // 2) or 1)
+    if pdf_path is None or page_count < PARALLEL_SCAN_MIN_PAGES or workers < 2:
+        return _scan_pages(pdf.pages, 0)
+
+    bounds = [page_count * i // workers for i in range(workers + 1)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunks = executor.map(
+            _scan_page_range, repeat(pdf_path, workers), bounds[:-1], bounds[1:],
+        )
+        return [scan for chunk in chunks for scan in chunk]
+
+
+# Cache of extract_tables() results keyed by (page_number, settings signature).
+# Shared by the continuation check and every strategy pass for one PDF so that
+# the default (S1 lines/lines) extraction is only run once per page.
+TablesCache = dict[tuple[int, str], list]
+
+
+def _extract_tables_cached(
+    page: pdfplumber.pdf.Page,
+    table_settings: dict | None,
+    tables_cache: TablesCache | None,
+) -> list:
+    """Return ``page.extract_tables(table_settings)``, memoized in *tables_cache*."""
+    settings = table_settings if table_settings is not None else _DEFAULT_TABLE_SETTINGS
+    if tables_cache is None:
+        return page.extract_tables(table_settings=settings)
+
+    key = (page.page_number, json.dumps(settings, sort_keys=True))
+    tables = tables_cache.get(key)
+    if tables is None:
+        tables = page.extract_tables(table_settings=settings)
+        tables_cache[key] = tables
+    return tables
+
+
+def _is_continuation_page(
+    page: pdfplumber.pdf.Page,
+    expected_cols: int,
+    tables_cache: TablesCache | None = None,
+) -> bool:
     """Check if a page continues the previous statement table."""
-    tables = page.extract_tables()
+    tables = _extract_tables_cached(page, None, tables_cache)
     if not tables:
         return False
 
@@ -668,39 +774,53 @@ def _merge_tables(tables: list[list[list[str | None]]]) -> list[list[str | None]
         return []
 
     # Find the most common column count (typically 3: item, prior, current)
-    col_counts: dict[int, int] = {}
-    for t in tables:
-        for row in t:
-            if row:
-                n = len(row)
-                col_counts[n] = col_counts.get(n, 0) + 1
+    col_counts = Counter(len(row) for t in tables for row in t if row)
     if not col_counts:
         return []
 
-    target_cols = max(col_counts, key=lambda k: col_counts[k])
+    target_cols = col_counts.most_common(1)[0][0]
+    candidate_rows = [row for t in tables for row in t if row and len(row) == target_cols]
 
     merged: list[list[str | None]] = []
     seen_headers: set[str] = set()
-    for t in tables:
-        for row in t:
-            if not row or len(row) != target_cols:
-                continue
-            # Keep unit/period header rows (may have empty first cell) but dedup
-            if _is_unit_row(row) or _is_period_header_row(row):
-                key = "|".join(c or "" for c in row)
-                if key in seen_headers:
-                    continue
-                seen_headers.add(key)
-                merged.append(row)
-                continue
-            # For data rows, skip if first cell (item name) is empty
-            first = (row[0] or "").strip()
-            if not first:
+    for row in candidate_rows:
+        joined = _CELL_SEP.join(c or "" for c in row)
+        kind = _classify_row(row, joined)
+        if kind == "skip":
+            continue
+        # Keep unit/period header rows (may have empty first cell) but dedup
+        if kind != "data":
+            if joined in seen_headers:
                 continue
-            merged.append(row)
+            seen_headers.add(joined)
+        merged.append(row)
     return merged
 
 
+# Cells are joined with a separator that never occurs in PDF text so that a
+# single regex search can classify a row without matching across cells.
+_CELL_SEP = "\x01"
+_UNIT_ROW_RE = re.compile(r"単位|千円|百万円")
+_PERIOD_ROW_RE = re.compile(r"年度|年[^\x01]*月|月[^\x01]*年")
+
+
+def _classify_row(row: list[str | None], joined: str | None = None) -> str:
+    """Classify a table row as "unit", "period", "data" or "skip".
+
+    Equivalent to _is_unit_row / _is_period_header_row plus the empty
+    item-name check, but scans the row text once per pattern.
+    """
+    if joined is None:
+        joined = _CELL_SEP.join(c or "" for c in row)
+    if _UNIT_ROW_RE.search(joined):
+        return "unit"
+    if _PERIOD_ROW_RE.search(joined):
+        return "period"
+    if not (row[0] or "").strip():
+        return "skip"
+    return "data"
+
+
 def _is_unit_row(row: list[str | None]) -> bool:
     """Check if a table row is a unit header row."""
     text = " ".join(cell or "" for cell in row)
@@ -715,14 +835,6 @@ def _is_period_header_row(row: list[str | None]) -> bool:
     return False
 
 
-_DURATION_START_ALL_RE = re.compile(
-    r"自\s*(?:(\d{4})\s*年|(令和|平成|昭和)\s*(\d{1,2})\s*年)\s*(\d{1,2})\s*月\s*(\d{1,2})\s*日"
-)
-_DURATION_END_ALL_RE = re.compile(
-    r"至\s*(?:(\d{4})\s*年|(令和|平成|昭和)\s*(\d{1,2})\s*年)\s*(\d{1,2})\s*月\s*(\d{1,2})\s*日"
-)
-
-
 def _extract_periods_from_page_text(page_text: str) -> list[PeriodInfo]:
     """Fallback: extract period info from page text when table headers lack dates.
 
@@ -732,22 +844,18 @@ def _extract_periods_from_page_text(page_text: str) -> list[PeriodInfo]:
     # Use only the first portion of the page (before financial data rows)
     header_text = page_text[:1500]
 
-    # Collect all 自 (start) and 至 (end) dates
+    # Collect all 自 (start) and 至 (end) dates, plus every date for the
+    # instant fallback (Western dates ahead of era dates)
     starts: list[str] = []
-    for m in _DURATION_START_ALL_RE.finditer(header_text):
-        if m.group(1):
-            year = int(m.group(1))
-        else:
-            year = _era_to_western(m.group(2), int(m.group(3)))
-        starts.append(f"{year}-{int(m.group(4)):02d}-{int(m.group(5)):02d}")
-
     ends: list[str] = []
-    for m in _DURATION_END_ALL_RE.finditer(header_text):
-        if m.group(1):
-            year = int(m.group(1))
-        else:
-            year = _era_to_western(m.group(2), int(m.group(3)))
-        ends.append(f"{year}-{int(m.group(4)):02d}-{int(m.group(5)):02d}")
+    western: list[str] = []
+    era: list[str] = []
+    for marker, iso, is_era in _iter_header_dates(header_text):
+        if marker == "自":
+            starts.append(iso)
+        elif marker == "至":
+            ends.append(iso)
+        (era if is_era else western).append(iso)
 
     # Pair starts and ends by order (1st 自 → 1st 至, 2nd 自 → 2nd 至)
     if starts and ends and len(starts) == len(ends):
@@ -761,14 +869,7 @@ def _extract_periods_from_page_text(page_text: str) -> list[PeriodInfo]:
         return periods
 
     # Fallback to instant dates (BS)
-    instants: list[str] = []
-    for m in _WESTERN_DATE_RE.finditer(header_text):
-        iso = f"{m.group(1)}-{int(m.group(2)):02d}-{int(m.group(3)):02d}"
-        instants.append(iso)
-    for m in _ERA_DATE_RE.finditer(header_text):
-        year = _era_to_western(m.group(1), int(m.group(2)))
-        iso = f"{year}-{int(m.group(3)):02d}-{int(m.group(4)):02d}"
-        instants.append(iso)
+    instants = western + era
 
     # Deduplicate while preserving order
     seen: set[str] = set()
@@ -795,6 +896,7 @@ def _extract_table_from_page(
     page: pdfplumber.pdf.Page,
     is_header_page: bool,
     table_settings: dict | None = None,
+    tables_cache: TablesCache | None = None,
 ) -> tuple[list[PeriodInfo], list[list[str | None]], int, str]:
     """Extract table data from a single page.
 
@@ -803,10 +905,7 @@ def _extract_table_from_page(
     Returns (periods, data_rows, unit_multiplier, unit_label).
     """
     page_text = page.extract_text() or ""
-    if table_settings is not None:
-        tables = page.extract_tables(table_settings=table_settings)
-    else:
-        tables = page.extract_tables()
+    tables = _extract_tables_cached(page, table_settings, tables_cache)
 
     merged = _merge_tables(tables) if tables else []
 
@@ -867,17 +966,65 @@ def _count_non_empty_value_cols(rows: list[list[str | None]]) -> int:
     return count
 
 
+def _is_good_enough(
+    statement_type: str | None,
+    periods: list[PeriodInfo],
+    rows: list[list[str | None]],
+    score: int,
+) -> bool:
+    """Return True when a strategy result makes the remaining strategies moot.
+
+    Besides the full concept score, every value column must be filled
+    (mirroring the data-quality override) and matched by a parsed period;
+    a table with more value columns than periods may still yield more
+    periods under another strategy, which would outrank this one.
+    """
+    threshold = _GOOD_ENOUGH_SCORE.get(statement_type or "")
+    if not threshold or score < threshold or len(periods) < _GOOD_ENOUGH_MIN_PERIODS:
+        return False
+    expected_data_cols = max((len(r) for r in rows), default=0) - 1
+    if len(periods) < expected_data_cols:
+        return False
+    return _count_non_empty_value_cols(rows) >= expected_data_cols
+
+
+_Candidate = tuple[list[PeriodInfo], list[list[str | None]], int, str, str, int]
+
+
+def _candidate_rank(candidate: _Candidate) -> tuple[int, int]:
+    """Sort key for strategy candidates: (period_count, concept_score)."""
+    return len(candidate[0]), candidate[5]
+
+
+def _concepts_with_values(rows: list[list[str | None]]) -> set[str]:
+    """Canonical concepts whose row has at least one non-empty value cell."""
+    found: set[str] = set()
+    for row in rows:
+        if row and row[0]:
+            c = map_concept(row[0].strip())
+            if c is not None:
+                for cell in row[1:]:
+                    if cell and cell.strip() and cell.strip() not in _EMPTY_VALUES:
+                        found.add(c)
+                        break
+    return found
+
+
 def _try_strategies(
     pages: list[pdfplumber.pdf.Page],
     is_header_flags: list[bool],
+    tables_cache: TablesCache | None = None,
+    statement_type: str | None = None,
 ) -> tuple[list[PeriodInfo], list[list[str | None]], int, str, str, int]:
     """Try multiple table_settings strategies, pick the best one.
 
     Selection: (period_count, concept_score) — more periods wins first,
-    then higher concept_score breaks ties.
+    then higher concept_score breaks ties.  When *statement_type* is given,
+    strategies stop as soon as one finds every known concept for that
+    statement with a period for each value column (see ``_is_good_enough``).
     Returns (periods, data_rows, multiplier, unit_label, strategy_id, score).
     """
-    candidates: list[tuple[list[PeriodInfo], list[list[str | None]], int, str, str, int]] = []
+    candidates: list[_Candidate] = []
 
     for strategy in STRATEGIES:
         all_periods: list[PeriodInfo] = []
@@ -888,6 +1035,7 @@ def _try_strategies(
         for page, is_header in zip(pages, is_header_flags):
             periods, rows, mult, ulabel = _extract_table_from_page(
                 page, is_header_page=is_header, table_settings=strategy["settings"],
+                tables_cache=tables_cache,
             )
             if is_header and periods:
                 all_periods = periods
@@ -898,10 +1046,16 @@ def _try_strategies(
 
         score = _concept_score(all_rows)
         candidates.append((all_periods, all_rows, multiplier, unit_label, strategy["id"], score))
+        if _is_good_enough(statement_type, all_periods, all_rows, score):
+            break
 
     # Select best strategy: prefer more periods extracted, then by concept_score
-    candidates.sort(key=lambda c: (len(c[0]), c[5]), reverse=True)
-    periods, rows, multiplier, unit_label, sid, score = candidates[0]
+    # Ranks are kept in a parallel list and only indices are sorted, so the
+    # sort never touches the (large) period/row payloads.  Python's sort is
+    # stable under reverse=True, so ties keep STRATEGIES order (S1 first).
+    ranks = [_candidate_rank(c) for c in candidates]
+    order = sorted(range(len(candidates)), key=ranks.__getitem__, reverse=True)
+    periods, rows, multiplier, unit_label, sid, score = candidates[order[0]]
 
     # Data-quality override: detect when the winning strategy lost data
     # columns during table extraction.  This happens when a strategy
@@ -913,7 +1067,8 @@ def _try_strategies(
     expected_data_cols = max(max_row_cols - 1, 0)
     winning_value_cols = _count_non_empty_value_cols(rows)
     if winning_value_cols < expected_data_cols:
-        for alt_periods, alt_rows, alt_mult, alt_ulabel, alt_sid, alt_score in candidates[1:]:
+        for idx in order[1:]:
+            alt_periods, alt_rows, alt_mult, alt_ulabel, alt_sid, alt_score = candidates[idx]
             alt_value_cols = _count_non_empty_value_cols(alt_rows)
             if alt_value_cols >= expected_data_cols and alt_score >= score:
                 rows = alt_rows
@@ -939,16 +1094,7 @@ def _try_strategies(
                     break
 
     # Supplement: fill missing concepts from text extraction
-    found_concepts: set[str] = set()
-    for row in rows:
-        if row and row[0]:
-            c = map_concept((row[0] or "").strip())
-            if c is not None:
-                # Only count if at least one value column is non-empty
-                for cell in row[1:]:
-                    if cell and cell.strip() and cell.strip() not in _EMPTY_VALUES:
-                        found_concepts.add(c)
-                        break
+    found_concepts = _concepts_with_values(rows)
 
     for page in pages:
         page_text = page.extract_text() or ""
@@ -969,10 +1115,13 @@ def _try_strategies(
     return periods, rows, multiplier, unit_label, sid, score
 
 
-def _extract_financial_pages(pdf: pdfplumber.PDF) -> list[ExtractedStatement]:
+def _extract_financial_pages(
+    pdf: pdfplumber.PDF,
+    pdf_path: Path | None = None,
+) -> list[ExtractedStatement]:
     """Multi-strategy extraction: find headers, collect pages, try strategies."""
     # Pass 1: scan for headers
-    scans = _scan_statement_headers(pdf)
+    scans = _scan_statement_headers(pdf, pdf_path)
     if not scans:
         return []
 
@@ -985,6 +1134,7 @@ def _extract_financial_pages(pdf: pdfplumber.PDF) -> list[ExtractedStatement]:
             unique_scans.append(scan)
 
     statements: list[ExtractedStatement] = []
+    tables_cache: TablesCache = {}
 
     for i, scan in enumerate(unique_scans):
         # Determine upper bound: next statement header page or end of PDF
@@ -1007,7 +1157,7 @@ def _extract_financial_pages(pdf: pdfplumber.PDF) -> list[ExtractedStatement]:
                 break
 
             # Check continuation with default settings
-            if not _is_continuation_page(page, expected_cols=3):
+            if not _is_continuation_page(page, expected_cols=3, tables_cache=tables_cache):
                 break
 
             stmt_pages.append(page)
@@ -1016,7 +1166,8 @@ def _extract_financial_pages(pdf: pdfplumber.PDF) -> list[ExtractedStatement]:
 
         # Try all strategies on the collected pages
         periods, rows, multiplier, unit_label, sid, score = _try_strategies(
-            stmt_pages, is_header_flags,
+            stmt_pages, is_header_flags, tables_cache=tables_cache,
+            statement_type=scan.statement_type,
         )
 
         statements.append(ExtractedStatement(
@@ -1156,6 +1307,70 @@ def _apply_half_year_correction(
     return corrected if applied else None
 
 
+# Optional on-disk cache of the pdfplumber extraction stage.  Enabled only
+# when this environment variable names a directory.  Entries are read with
+# pickle.load, so the directory must be trusted (writable only by the user).
+CACHE_DIR_ENV = "PDF_PARSER_CACHE_DIR"
+
+
+def _extraction_cache_path(pdf_path: Path) -> Path | None:
+    """Return the cache file for *pdf_path*, or None when caching is off.
+
+    The key covers the full PDF content and the parser version, so edited
+    PDFs and parser upgrades never hit stale entries.
+    """
+    cache_dir = os.environ.get(CACHE_DIR_ENV)
+    if not cache_dir:
+        return None
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(__version__.encode("utf-8"))
+    with pdf_path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return Path(cache_dir).expanduser() / f"{digest.hexdigest()}.pkl"
+
+
+def _extract_statements(pdf_path: Path) -> list[ExtractedStatement]:
+    """Run the pdfplumber extraction stage, memoized on disk when enabled."""
+    cache_path = _extraction_cache_path(pdf_path)
+    if cache_path is not None and cache_path.exists():
+        try:
+            with cache_path.open("rb") as f:
+                cached = pickle.load(f)
+        except (
+            OSError, pickle.UnpicklingError, EOFError, AttributeError,
+            ValueError, TypeError, ImportError,
+        ) as exc:
+            logger.warning("Ignoring unreadable PDF cache %s: %s", cache_path, exc)
+        else:
+            if isinstance(cached, list) and all(
+                isinstance(stmt, ExtractedStatement) for stmt in cached
+            ):
+                return cached
+            logger.warning("Ignoring malformed PDF cache %s", cache_path)
+
+    with pdfplumber.open(pdf_path) as pdf:
+        statements = _extract_financial_pages(pdf, pdf_path)
+
+    if cache_path is not None:
+        tmp_path: Path | None = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Unique temp name so concurrent writers never share a partial file
+            with tempfile.NamedTemporaryFile(
+                dir=cache_path.parent, prefix=cache_path.stem, suffix=".tmp", delete=False,
+            ) as f:
+                tmp_path = Path(f.name)
+                pickle.dump(statements, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path.replace(cache_path)
+        except OSError as exc:
+            logger.warning("Could not write PDF cache %s: %s", cache_path, exc)
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+
+    return statements
+
+
 def parse_pdf(
     pdf_path: Path,
     ticker: str,
@@ -1177,10 +1392,13 @@ def parse_pdf(
         manifest_period_end: Fiscal year end from manifest.  Used with
             doc_type_code="160" to identify which periods to correct.
 
+    When ``PDF_PARSER_CACHE_DIR`` is set, the table extraction result is
+    cached there by PDF content hash, so re-parsing an unchanged PDF skips
+    pdfplumber entirely.
+
     Returns (ParsedDocument, PdfParseMetadata).
     """
-    with pdfplumber.open(pdf_path) as pdf:
-        statements = _extract_financial_pages(pdf)
+    statements = _extract_statements(pdf_path)
 
     periods = _build_period_financials(statements)
 
@@ -0,0 +1,35 @@
+"""disclosure-parser テスト用 pytest 設定"""
+
+from pathlib import Path
+
+import pytest
+
+_TESTS_DIR = Path(__file__).resolve().parent
+
+# 実PDFを開くテストクラスの名前接頭辞
+_PDF_HEAVY_CLASS_PREFIXES = ("TestIntegration", "TestParallelHeaderScan")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line("markers", "pdfheavy: 実PDFを解析する統合テスト（低速）")
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    # 実PDFを開くテスト (TestIntegration*, TestParallelHeaderScan) に pdfheavy を付けて先頭へ並べる。
+    # リポジトリ直下から実行した場合も、対象はこのディレクトリのテストに限る。
+    # pytest-xdist の --dist loadscope ではクラス単位で先に配られるため、
+    # setUpClass のキャッシュを保ったまま重いPDF解析が並列に走り、末尾の待ちが減る。
+    heavy: list[pytest.Item] = []
+    light: list[pytest.Item] = []
+    for item in items:
+        cls = getattr(item, "cls", None)
+        if (
+            cls is not None
+            and cls.__name__.startswith(_PDF_HEAVY_CLASS_PREFIXES)
+            and item.path.is_relative_to(_TESTS_DIR)
+        ):
+            item.add_marker(pytest.mark.pdfheavy)
+            heavy.append(item)
+        else:
+            light.append(item)
+    items[:] = heavy + light
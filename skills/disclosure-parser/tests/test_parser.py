@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import contextlib
+import importlib.util
+import io
 import json
 from pathlib import Path
+import pickle
+import shutil
 import subprocess
 import sys
 import tempfile
 import unittest
+from unittest import mock
 import zipfile
 
 SCRIPT_DIR = Path(__file__).resolve().parents[1] / "scripts"
@@ -15,6 +21,19 @@ if str(SCRIPT_DIR) not in sys.path:
 import parser as disclosure_parser
 
 
+def _load_cli_module():
+    # 他スキルの scripts/main.py と sys.modules["main"] を奪い合わないよう固有名で読み込む
+    spec = importlib.util.spec_from_file_location(
+        "disclosure_parser_main", SCRIPT_DIR / "main.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+parser_main = _load_cli_module()
+
+
 SAMPLE_XBRL = """<?xml version="1.0" encoding="UTF-8"?>
 <xbrl
   xmlns="http://www.xbrl.org/2003/instance"
@@ -106,43 +125,103 @@ SAMPLE_XBRL_WITH_NONCURRENT_ONLY = """<?xml version="1.0" encoding="UTF-8"?>
 """
 
 
-def _create_sample_zip(zip_path: Path, xbrl_body: str = SAMPLE_XBRL) -> None:
+_SAMPLE_XBRL_BYTES = SAMPLE_XBRL.encode("utf-8")
+_SAMPLE_BARE_LIABILITIES_BYTES = SAMPLE_XBRL_WITH_BARE_LIABILITIES.encode("utf-8")
+_SAMPLE_NONCURRENT_BYTES = SAMPLE_XBRL_WITH_NONCURRENT_ONLY.encode("utf-8")
+
+
+def _create_sample_zip(zip_path: Path, xbrl_body: str | bytes = _SAMPLE_XBRL_BYTES) -> None:
+    # The payloads are a few KB, so skip deflate; the parser reads stored
+    # members the same way.
     zip_path.parent.mkdir(parents=True, exist_ok=True)
-    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_STORED) as archive:
         archive.writestr("XBRL/PublicDoc/sample.xbrl", xbrl_body)
 
 
 class DisclosureParserTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Read-only tests share one SAMPLE_XBRL zip; tests that need it inside
+        # an input directory copy it rather than re-compressing.
+        cls._sample_tmp = tempfile.TemporaryDirectory()
+        cls.sample_zip = Path(cls._sample_tmp.name) / "S100TEST.zip"
+        _create_sample_zip(cls.sample_zip)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._sample_tmp.cleanup()
+
+    def _copy_sample_zip(self, destination: Path) -> None:
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(self.sample_zip, destination)
+
     def test_parse_edinet_zip_extracts_normalized_statements(self) -> None:
+        parsed = disclosure_parser.parse_edinet_zip(self.sample_zip, ticker="2780")
+
+        self.assertEqual(parsed.document_id, "S100TEST")
+        self.assertEqual(parsed.company_name, "株式会社コメ兵ホールディングス")
+        self.assertEqual(len(parsed.periods), 1)
+
+        period = parsed.periods[0]
+        self.assertEqual(period.period_end, "2024-03-31")
+        self.assertEqual(period.period_start, "2023-04-01")
+        self.assertEqual(period.period_type, "mixed")
+        self.assertEqual(period.bs["total_assets"], 1000)
+        self.assertEqual(period.bs["total_liabilities"], 400)
+        self.assertEqual(period.pl["revenue"], 1200)
+        self.assertEqual(period.pl["operating_income"], 100)
+        self.assertEqual(period.cf["operating_cf"], 140)
+        self.assertEqual(period.cf["investing_cf"], -30)
+        self.assertEqual(period.cf["free_cash_flow"], 110)
+        self.assertIsNone(period.bs["total_equity"])
+
+    def test_parsed_document_round_trips_through_pickle(self) -> None:
+        # Documents cross process boundaries (parallel directory parsing and
+        # the PDF extraction cache), so the slotted dataclasses must pickle.
+        parsed = disclosure_parser.parse_edinet_zip(self.sample_zip, ticker="2780")
+        restored = pickle.loads(pickle.dumps(parsed))
+
+        self.assertFalse(hasattr(parsed.periods[0], "__dict__"))
+        self.assertEqual(restored.to_dict(), parsed.to_dict())
+
+    def test_relevant_concept_rejects_unmapped_tags(self) -> None:
+        jppfs = "{http://disclosure.edinet-fsa.go.jp/taxonomy/jppfs/2023-03-31/jppfs_cor}"
+        jpdei = "{http://disclosure.edinet-fsa.go.jp/taxonomy/jpdei/2023-03-31/jpdei_cor}"
+
+        self.assertIsNone(disclosure_parser._relevant_concept(f"{jppfs}NotesReceivableTrade"))
+        self.assertEqual(
+            disclosure_parser._relevant_concept(f"{jppfs}TotalAssets"),
+            ("totalassets", "total_assets"),
+        )
+        normalized, canonical = disclosure_parser._relevant_concept(f"{jpdei}FilerNameInJapaneseDEI")
+        self.assertIn(normalized, disclosure_parser.COMPANY_NAME_CONCEPTS)
+        self.assertIsNone(canonical)
+
+    def test_facts_before_context_declaration_are_resolved(self) -> None:
+        head, _, rest = SAMPLE_XBRL.partition("  <context id=\"CurrentYearInstant_ConsolidatedMember\">")
+        contexts, _, facts = ("  <context id=\"CurrentYearInstant_ConsolidatedMember\">" + rest).partition(
+            "  <unit id=\"JPY\">"
+        )
+        facts = "  <unit id=\"JPY\">" + facts.replace("</xbrl>\n", "")
+        reordered = head + facts + contexts + "</xbrl>\n"
+
         with tempfile.TemporaryDirectory() as tmp:
-            zip_path = Path(tmp) / "S100TEST.zip"
-            _create_sample_zip(zip_path)
+            zip_path = Path(tmp) / "S100LATE.zip"
+            _create_sample_zip(zip_path, reordered)
 
             parsed = disclosure_parser.parse_edinet_zip(zip_path, ticker="2780")
 
-            self.assertEqual(parsed.document_id, "S100TEST")
             self.assertEqual(parsed.company_name, "株式会社コメ兵ホールディングス")
             self.assertEqual(len(parsed.periods), 1)
-
-            period = parsed.periods[0]
-            self.assertEqual(period.period_end, "2024-03-31")
-            self.assertEqual(period.period_start, "2023-04-01")
-            self.assertEqual(period.period_type, "mixed")
-            self.assertEqual(period.bs["total_assets"], 1000)
-            self.assertEqual(period.bs["total_liabilities"], 400)
-            self.assertEqual(period.pl["revenue"], 1200)
-            self.assertEqual(period.pl["operating_income"], 100)
-            self.assertEqual(period.cf["operating_cf"], 140)
-            self.assertEqual(period.cf["investing_cf"], -30)
-            self.assertEqual(period.cf["free_cash_flow"], 110)
-            self.assertIsNone(period.bs["total_equity"])
+            self.assertEqual(parsed.periods[0].bs["total_assets"], 1000)
+            self.assertEqual(parsed.periods[0].pl["revenue"], 1200)
 
     def test_write_outputs_creates_document_and_aggregate_json(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             base = Path(tmp)
             input_dir = base / "raw" / "edinet"
             output_dir = base / "parsed"
-            _create_sample_zip(input_dir / "S100TEST.zip")
+            self._copy_sample_zip(input_dir / "S100TEST.zip")
 
             documents = disclosure_parser.parse_edinet_directory(
                 input_dir=input_dir,
@@ -163,10 +242,43 @@ class DisclosureParserTests(unittest.TestCase):
             self.assertEqual(payload["document_count"], 1)
             self.assertEqual(payload["period_index"][0]["pl"]["net_income"], 50)
 
+    def test_parse_edinet_directory_parallel_keeps_order(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            input_dir = Path(tmp) / "raw"
+            count = disclosure_parser.PARALLEL_MIN_ZIPS + 1
+            for idx in range(count):
+                self._copy_sample_zip(input_dir / f"S100P{idx:03d}.zip")
+
+            documents = disclosure_parser.parse_edinet_directory(
+                input_dir, ticker="2780", workers=2,
+            )
+
+            self.assertEqual(
+                [doc.document_id for doc in documents],
+                [f"S100P{idx:03d}" for idx in range(count)],
+            )
+            self.assertTrue(all(doc.periods[0].bs["total_assets"] == 1000 for doc in documents))
+            sequential = disclosure_parser.parse_edinet_directory(input_dir, ticker="2780")
+            self.assertEqual(
+                [doc.to_dict() for doc in documents], [doc.to_dict() for doc in sequential],
+            )
+
+    def test_parse_edinet_directory_sequential_by_default(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            input_dir = Path(tmp) / "raw"
+            for idx in range(disclosure_parser.PARALLEL_MIN_ZIPS):
+                self._copy_sample_zip(input_dir / f"S100Q{idx:03d}.zip")
+
+            with mock.patch.object(disclosure_parser, "ProcessPoolExecutor") as pool:
+                documents = disclosure_parser.parse_edinet_directory(input_dir, ticker="2780")
+
+            pool.assert_not_called()
+            self.assertEqual(len(documents), disclosure_parser.PARALLEL_MIN_ZIPS)
+
     def test_non_current_concepts_do_not_map_to_current_fields(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             zip_path = Path(tmp) / "S100NONCURRENT.zip"
-            _create_sample_zip(zip_path, xbrl_body=SAMPLE_XBRL_WITH_NONCURRENT_ONLY)
+            _create_sample_zip(zip_path, xbrl_body=_SAMPLE_NONCURRENT_BYTES)
 
             parsed = disclosure_parser.parse_edinet_zip(zip_path, ticker="2780")
             self.assertEqual(len(parsed.periods), 1)
@@ -180,7 +292,7 @@ class DisclosureParserTests(unittest.TestCase):
     def test_bare_liabilities_maps_to_total_liabilities(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             zip_path = Path(tmp) / "S100BARE.zip"
-            _create_sample_zip(zip_path, xbrl_body=SAMPLE_XBRL_WITH_BARE_LIABILITIES)
+            _create_sample_zip(zip_path, xbrl_body=_SAMPLE_BARE_LIABILITIES_BYTES)
 
             parsed = disclosure_parser.parse_edinet_zip(zip_path, ticker="2780")
             self.assertEqual(len(parsed.periods), 1)
@@ -209,7 +321,33 @@ class DisclosureParserTests(unittest.TestCase):
             base = Path(tmp)
             input_dir = base / "data" / "2780" / "raw" / "edinet"
             output_dir = base / "data" / "2780" / "parsed"
-            _create_sample_zip(input_dir / "S100TEST.zip")
+            self._copy_sample_zip(input_dir / "S100TEST.zip")
+
+            stdout = io.StringIO()
+            with contextlib.redirect_stdout(stdout):
+                rc = parser_main.main(
+                    [
+                        "--ticker",
+                        "2780",
+                        "--input-dir",
+                        str(input_dir),
+                        "--output-dir",
+                        str(output_dir),
+                    ]
+                )
+
+            self.assertEqual(rc, 0)
+            self.assertIn("Parsed 1 XBRL document(s).", stdout.getvalue())
+            self.assertTrue((output_dir / "S100TEST.json").exists())
+            self.assertTrue((output_dir / "financials.json").exists())
+
+    def test_cli_script_end_to_end(self) -> None:
+        """One real subprocess run of main.py to cover the script entrypoint."""
+        with tempfile.TemporaryDirectory() as tmp:
+            base = Path(tmp)
+            input_dir = base / "data" / "2780" / "raw" / "edinet"
+            output_dir = base / "data" / "2780" / "parsed"
+            self._copy_sample_zip(input_dir / "S100TEST.zip")
 
             main_py = SCRIPT_DIR / "main.py"
             result = subprocess.run(
@@ -257,13 +395,10 @@ class DisclosureParserTests(unittest.TestCase):
 
     def test_total_liabilities_no_fallback_when_present(self) -> None:
         """total_liabilities が既に XBRL に存在 → フォールバック不発動"""
-        with tempfile.TemporaryDirectory() as tmp:
-            zip_path = Path(tmp) / "S100PRESENT.zip"
-            _create_sample_zip(zip_path, xbrl_body=SAMPLE_XBRL)
-            parsed = disclosure_parser.parse_edinet_zip(zip_path, ticker="2780")
-            period = parsed.periods[0]
-            self.assertEqual(period.bs["total_liabilities"], 400)
-            self.assertNotIn("total_liabilities", period._calculated_fields)
+        parsed = disclosure_parser.parse_edinet_zip(self.sample_zip, ticker="2780")
+        period = parsed.periods[0]
+        self.assertEqual(period.bs["total_liabilities"], 400)
+        self.assertNotIn("total_liabilities", period._calculated_fields)
 
     def test_total_liabilities_no_fallback_when_net_assets_missing(self) -> None:
         """total_assets のみで net_assets がない → フォールバック不発動"""
@@ -434,58 +569,51 @@ class DisclosureParserTests(unittest.TestCase):
 
     def test_build_period_index_omits_empty_calculated_fields(self) -> None:
         """calculated_fields が空のときは出力に含まれない"""
-        with tempfile.TemporaryDirectory() as tmp:
-            zip_path = Path(tmp) / "S100FULL.zip"
-            _create_sample_zip(zip_path, xbrl_body=SAMPLE_XBRL)
-            docs = [disclosure_parser.parse_edinet_zip(zip_path, ticker="2780")]
-            # SAMPLE_XBRL は free_cash_flow のみ calculated
-            # ただし free_cash_flow は calculated なので、このテストは
-            # 全フィールドが直接提供されるケースが必要
-            # → total_liabilities が直接提供、CF も直接提供のケースを使う
-            # SAMPLE_XBRL は operating_cf + investing_cf があるので free_cash_flow は calculated
-            # 代わりに直接 PeriodFinancial を作ってテストする
-            period = disclosure_parser.PeriodFinancial(
-                period_end="2024-03-31",
-                period_start="2023-04-01",
-                period_type="duration",
-                fiscal_year=2024,
-            )
-            period.bs["total_assets"] = 1000
-            # finalize せずに _calculated_fields は空のまま
-            doc = disclosure_parser.ParsedDocument(
-                document_id="S100EMPTY",
-                source_zip="dummy.zip",
-                company_name="Test Corp",
-                ticker="9999",
-                periods=[period],
-            )
-            index = disclosure_parser.build_period_index([doc])
-            self.assertEqual(len(index), 1)
-            self.assertNotIn("calculated_fields", index[0])
+        docs = [disclosure_parser.parse_edinet_zip(self.sample_zip, ticker="2780")]
+        # SAMPLE_XBRL は free_cash_flow のみ calculated
+        # ただし free_cash_flow は calculated なので、このテストは
+        # 全フィールドが直接提供されるケースが必要
+        # → total_liabilities が直接提供、CF も直接提供のケースを使う
+        # SAMPLE_XBRL は operating_cf + investing_cf があるので free_cash_flow は calculated
+        # 代わりに直接 PeriodFinancial を作ってテストする
+        period = disclosure_parser.PeriodFinancial(
+            period_end="2024-03-31",
+            period_start="2023-04-01",
+            period_type="duration",
+            fiscal_year=2024,
+        )
+        period.bs["total_assets"] = 1000
+        # finalize せずに _calculated_fields は空のまま
+        doc = disclosure_parser.ParsedDocument(
+            document_id="S100EMPTY",
+            source_zip="dummy.zip",
+            company_name="Test Corp",
+            ticker="9999",
+            periods=[period],
+        )
+        index = disclosure_parser.build_period_index([doc])
+        self.assertEqual(len(index), 1)
+        self.assertNotIn("calculated_fields", index[0])
 
     def test_cli_rejects_mismatched_code_and_ticker(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
-            main_py = SCRIPT_DIR / "main.py"
-            result = subprocess.run(
-                [
-                    sys.executable,
-                    str(main_py),
-                    "--code",
-                    "2780",
-                    "--ticker",
-                    "9999",
-                    "--input-dir",
-                    tmp,
-                    "--output-dir",
-                    tmp,
-                ],
-                check=False,
-                capture_output=True,
-                text=True,
-            )
-
-            self.assertEqual(result.returncode, 1)
-            self.assertIn("differ", result.stderr)
+            stderr = io.StringIO()
+            with contextlib.redirect_stderr(stderr):
+                rc = parser_main.main(
+                    [
+                        "--code",
+                        "2780",
+                        "--ticker",
+                        "9999",
+                        "--input-dir",
+                        tmp,
+                        "--output-dir",
+                        tmp,
+                    ]
+                )
+
+            self.assertEqual(rc, 1)
+            self.assertIn("differ", stderr.getvalue())
 
 
     def test_total_liabilities_fallback_from_components(self) -> None:
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import os
 import sys
+import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 SCRIPT_DIR = Path(__file__).resolve().parents[1] / "scripts"
 if str(SCRIPT_DIR) not in sys.path:
@@ -55,121 +58,77 @@ class TestDetectUnit(unittest.TestCase):
         self.assertIn("デフォルト", l)
 
 
-class TestNormalizeValue(unittest.TestCase):
-    """負号正規化テスト（△/▲/括弧/ハイフン）"""
-
-    def test_plain_integer(self) -> None:
-        self.assertEqual(pdf_parser.normalize_value("1,234,567", 1), 1234567)
-
-    def test_triangle_negative(self) -> None:
-        self.assertEqual(pdf_parser.normalize_value("△1,234", 1), -1234)
-
-    def test_filled_triangle_negative(self) -> None:
-        self.assertEqual(pdf_parser.normalize_value("▲1,234", 1), -1234)
+# (入力, 乗数, 期待値)
+NORMALIZE_CASES: tuple[tuple[str | None, int, int | None], ...] = (
+    ("1,234,567", 1, 1234567),
+    ("△1,234", 1, -1234),
+    ("▲1,234", 1, -1234),
+    ("（1,234）", 1, -1234),
+    ("(1,234)", 1, -1234),
+    ("（ 1,234 ）", 1, -1234),
+    ("△ 1,234", 1, -1234),
+    ("-1,234", 1, -1234),
+    ("－1,234", 1, -1234),
+    ("−1,234,567", 1, -1234567),
+    ("100", 1_000, 100_000),
+    ("100", 1_000_000, 100_000_000),
+    (None, 1, None),
+    ("-", 1, None),
+    ("―", 1, None),
+    ("", 1, None),
+    ("※1,234", 1, 1234),
+)
 
-    def test_paren_negative(self) -> None:
-        self.assertEqual(pdf_parser.normalize_value("（1,234）", 1), -1234)
 
-    def test_half_paren_negative(self) -> None:
-        self.assertEqual(pdf_parser.normalize_value("(1,234)", 1), -1234)
-
-    def test_hyphen_negative(self) -> None:
-        self.assertEqual(pdf_parser.normalize_value("-1,234", 1), -1234)
-
-    def test_fullwidth_minus(self) -> None:
-        self.assertEqual(pdf_parser.normalize_value("－1,234", 1), -1234)
-
-    def test_multiplier_thousand(self) -> None:
-        self.assertEqual(pdf_parser.normalize_value("100", 1_000), 100_000)
+class TestNormalizeValue(unittest.TestCase):
+    """負号正規化テスト（△/▲/括弧/ハイフン）"""
 
-    def test_multiplier_million(self) -> None:
-        self.assertEqual(pdf_parser.normalize_value("100", 1_000_000), 100_000_000)
+    def test_cases(self) -> None:
+        for raw, multiplier, expected in NORMALIZE_CASES:
+            with self.subTest(raw=raw, multiplier=multiplier):
+                self.assertEqual(pdf_parser.normalize_value(raw, multiplier), expected)
 
-    def test_none_input(self) -> None:
+    def test_default_multiplier(self) -> None:
         self.assertIsNone(pdf_parser.normalize_value(None))
-
-    def test_dash(self) -> None:
-        self.assertIsNone(pdf_parser.normalize_value("-"))
-
-    def test_em_dash(self) -> None:
-        self.assertIsNone(pdf_parser.normalize_value("―"))
-
-    def test_empty_string(self) -> None:
-        self.assertIsNone(pdf_parser.normalize_value(""))
-
-    def test_footnote_marker_stripped(self) -> None:
-        self.assertEqual(pdf_parser.normalize_value("※1,234", 1), 1234)
+        self.assertEqual(pdf_parser.normalize_value("100"), 100)
+
+
+# (科目名, 期待する canonical key)
+MAP_CONCEPT_CASES: tuple[tuple[str, str | None], ...] = (
+    ("資産合計", "total_assets"),
+    ("売上高", "revenue"),
+    ("営業利益", "operating_income"),
+    ("親会社株主に帰属する当期純利益", "net_income"),
+    ("親会社株主に帰属する当期純損失", "net_income"),
+    ("営業活動によるキャッシュ・フロー", "operating_cf"),
+    ("投資活動によるキャッシュ・フロー", "investing_cf"),
+    ("財務活動によるキャッシュ・フロー", "financing_cf"),
+    ("純資産合計", "total_equity"),
+    # 前方一致: 利益/損失併記
+    ("親会社株主に帰属する当期純利益又は親会社株主に帰属する当期純損失（△）", "net_income"),
+    ("親会社株主に帰属する四半期純利益", "net_income"),
+    ("親会社株主に帰属する四半期純損失", "net_income"),
+    ("親会社株主に帰属する中間純利益", "net_income"),
+    ("四半期純利益", "net_income"),
+    ("未知の科目", None),
+    ("   ", None),
+    ("  売上高  ", "revenue"),
+    # BS は完全一致のみ: 流動/固定資産合計が total_assets に化けない
+    ("流動資産合計", "current_assets"),
+    ("固定資産合計", "noncurrent_assets"),
+    ("資産合計その他", None),
+    # BS ガード後も PL の前方一致は有効
+    ("営業利益又は営業損失（△）", "operating_income"),
+)
 
 
 class TestMapConcept(unittest.TestCase):
     """科目名マッピングテスト"""
 
-    def test_total_assets(self) -> None:
-        self.assertEqual(pdf_parser.map_concept("資産合計"), "total_assets")
-
-    def test_revenue(self) -> None:
-        self.assertEqual(pdf_parser.map_concept("売上高"), "revenue")
-
-    def test_operating_income(self) -> None:
-        self.assertEqual(pdf_parser.map_concept("営業利益"), "operating_income")
-
-    def test_net_income(self) -> None:
-        self.assertEqual(pdf_parser.map_concept("親会社株主に帰属する当期純利益"), "net_income")
-
-    def test_net_loss(self) -> None:
-        self.assertEqual(pdf_parser.map_concept("親会社株主に帰属する当期純損失"), "net_income")
-
-    def test_operating_cf(self) -> None:
-        self.assertEqual(pdf_parser.map_concept("営業活動によるキャッシュ・フロー"), "operating_cf")
-
-    def test_investing_cf(self) -> None:
-        self.assertEqual(pdf_parser.map_concept("投資活動によるキャッシュ・フロー"), "investing_cf")
-
-    def test_financing_cf(self) -> None:
-        self.assertEqual(pdf_parser.map_concept("財務活動によるキャッシュ・フロー"), "financing_cf")
-
-    def test_total_equity(self) -> None:
-        self.assertEqual(pdf_parser.map_concept("純資産合計"), "total_equity")
-
-    def test_prefix_match_loss_variant(self) -> None:
-        result = pdf_parser.map_concept("親会社株主に帰属する当期純利益又は親会社株主に帰属する当期純損失（△）")
-        self.assertEqual(result, "net_income")
-
-    def test_quarterly_net_income(self) -> None:
-        self.assertEqual(pdf_parser.map_concept("親会社株主に帰属する四半期純利益"), "net_income")
-
-    def test_quarterly_net_loss(self) -> None:
-        self.assertEqual(pdf_parser.map_concept("親会社株主に帰属する四半期純損失"), "net_income")
-
-    def test_interim_net_income(self) -> None:
-        self.assertEqual(pdf_parser.map_concept("親会社株主に帰属する中間純利益"), "net_income")
-
-    def test_quarterly_net_income_short(self) -> None:
-        self.assertEqual(pdf_parser.map_concept("四半期純利益"), "net_income")
-
-    def test_unknown_concept(self) -> None:
-        self.assertIsNone(pdf_parser.map_concept("未知の科目"))
-
-    def test_whitespace_stripped(self) -> None:
-        self.assertEqual(pdf_parser.map_concept("  売上高  "), "revenue")
-
-    def test_bs_exact_match_guard_current_assets(self) -> None:
-        """流動資産合計 must map to current_assets, not total_assets."""
-        self.assertEqual(pdf_parser.map_concept("流動資産合計"), "current_assets")
-
-    def test_bs_exact_match_guard_noncurrent_assets(self) -> None:
-        """固定資産合計 must map to noncurrent_assets, not total_assets."""
-        self.assertEqual(pdf_parser.map_concept("固定資産合計"), "noncurrent_assets")
-
-    def test_bs_exact_match_guard_no_prefix_leak(self) -> None:
-        """BS aliases must not prefix-match longer strings."""
-        # "資産合計その他" should NOT match total_assets via prefix
-        self.assertIsNone(pdf_parser.map_concept("資産合計その他"))
-
-    def test_pl_prefix_match_still_works(self) -> None:
-        """PL prefix match must still work after BS guard."""
-        result = pdf_parser.map_concept("営業利益又は営業損失（△）")
-        self.assertEqual(result, "operating_income")
+    def test_cases(self) -> None:
+        for name, expected in MAP_CONCEPT_CASES:
+            with self.subTest(name=name):
+                self.assertEqual(pdf_parser.map_concept(name), expected)
 
 
 class TestClassifyStatement(unittest.TestCase):
@@ -249,9 +208,26 @@ class TestParseColumnHeader(unittest.TestCase):
         self.assertEqual(info.period_start, "2024-04-01")
         self.assertEqual(info.period_end, "2025-03-31")
 
+    def test_era_duration(self) -> None:
+        info = pdf_parser.parse_column_header(
+            "前連結会計年度\n(自 平成30年4月1日\n至 平成31年3月31日)"
+        )
+        self.assertIsNotNone(info)
+        self.assertEqual(info.period_type, "duration")
+        self.assertEqual(info.period_start, "2018-04-01")
+        self.assertEqual(info.period_end, "2019-03-31")
+        self.assertEqual(info.label, "prior")
+
     def test_empty_returns_none(self) -> None:
         self.assertIsNone(pdf_parser.parse_column_header(""))
 
+    def test_repeated_header_is_cached_and_immutable(self) -> None:
+        header = "当連結会計年度\n(2025年３月31日)"
+        first = pdf_parser.parse_column_header(header)
+        self.assertIs(pdf_parser.parse_column_header(header), first)
+        with self.assertRaises(AttributeError):
+            first.label = "prior"  # type: ignore[misc]
+
 
 class TestConceptScore(unittest.TestCase):
     """concept_score 計算テスト"""
@@ -301,12 +277,13 @@ class TestStrategyScoring(unittest.TestCase):
             ([p_single], [], 1000, "千円", "S3", 3),             # 1 period, score 3
         ]
 
-        # Sort as _try_strategies does
-        candidates.sort(key=lambda c: (len(c[0]), c[5]), reverse=True)
+        # Rank as _try_strategies does; max() keeps the first of equal ranks,
+        # matching the stable reverse sort used there
+        winner = max(candidates, key=pdf_parser._candidate_rank)
 
         # S1 (2 periods) should win
-        self.assertEqual(candidates[0][4], "S1")
-        self.assertEqual(len(candidates[0][0]), 2)
+        self.assertEqual(winner[4], "S1")
+        self.assertEqual(len(winner[0]), 2)
 
 
 class TestMergeTables(unittest.TestCase):
@@ -339,6 +316,242 @@ class TestMergeTables(unittest.TestCase):
         self.assertEqual(len(period_rows), 1)
 
 
+class TestClassifyRow(unittest.TestCase):
+    """_classify_row テスト — unit/period/data/skip の一括判定"""
+
+    def test_kinds(self) -> None:
+        cases = {
+            ("", "（単位：千円）", ""): "unit",
+            ("", "前連結会計年度", "当連結会計年度"): "period",
+            ("", "(2024年３月31日)", ""): "period",
+            ("売上高", "100", "200"): "data",
+            ("", "50", "60"): "skip",
+        }
+        for row, expected in cases.items():
+            with self.subTest(row=row):
+                self.assertEqual(pdf_parser._classify_row(list(row)), expected)
+
+    def test_year_and_month_must_share_a_cell(self) -> None:
+        self.assertEqual(pdf_parser._classify_row(["売上高", "3年", "4月"]), "data")
+
+
+class _StubPage:
+    """Minimal pdfplumber.Page stand-in that only supports text extraction."""
+
+    def __init__(self, text: str) -> None:
+        self._text = text
+
+    def extract_text_simple(self) -> str:
+        return self._text
+
+    def extract_text(self) -> str:
+        raise AssertionError("header scan must not run full-layout extract_text")
+
+    def flush_cache(self) -> None:
+        pass
+
+
+class TestScanStatementHeaders(unittest.TestCase):
+    """_scan_statement_headers テスト — 簡易テキスト抽出によるヘッダー検出"""
+
+    def test_detects_headers_with_simple_text(self) -> None:
+        pages = [
+            _StubPage("目次"),
+            _StubPage("①【連結貸借対照表】"),
+            _StubPage("売上高 100 200"),
+            _StubPage("②【連結損益計算書】"),
+        ]
+        pdf = type("StubPdf", (), {"pages": pages})()
+        scans = pdf_parser._scan_statement_headers(pdf)
+        self.assertEqual(
+            [(s.page_num, s.statement_type) for s in scans],
+            [(2, "bs"), (4, "pl")],
+        )
+
+    def test_sequential_without_env(self) -> None:
+        pages = [_StubPage("売上高 100 200") for _ in range(pdf_parser.PARALLEL_SCAN_MIN_PAGES)]
+        pdf = type("StubPdf", (), {"pages": pages})()
+        with mock.patch.dict(os.environ, {}, clear=False), \
+                mock.patch.object(pdf_parser, "ProcessPoolExecutor") as pool:
+            os.environ.pop(pdf_parser.SCAN_WORKERS_ENV, None)
+            self.assertEqual(pdf_parser._scan_statement_headers(pdf, Path("report.pdf")), [])
+        pool.assert_not_called()
+
+
+@unittest.skipUnless(PDF_2025.exists(), "2025 PDF not available")
+class TestParallelHeaderScan(unittest.TestCase):
+    """PDF_PARSER_SCAN_WORKERS — 並列走査と逐次走査のヘッダー一致"""
+
+    def test_parallel_matches_sequential(self) -> None:
+        with pdf_parser.pdfplumber.open(PDF_2025) as pdf:
+            with mock.patch.dict(os.environ, {}, clear=False):
+                os.environ.pop(pdf_parser.SCAN_WORKERS_ENV, None)
+                sequential = pdf_parser._scan_statement_headers(pdf, PDF_2025)
+            with mock.patch.dict(os.environ, {pdf_parser.SCAN_WORKERS_ENV: "2"}), \
+                    mock.patch.object(pdf_parser, "PARALLEL_SCAN_MIN_PAGES", 4):
+                parallel = pdf_parser._scan_statement_headers(pdf, PDF_2025)
+        self.assertTrue(sequential)
+        self.assertEqual(parallel, sequential)
+
+
+class _CountingTablePage:
+    """pdfplumber.Page stand-in that counts extract_tables() calls."""
+
+    page_number = 5
+
+    def __init__(self) -> None:
+        self.calls: list[dict | None] = []
+
+    def extract_tables(self, table_settings: dict | None = None) -> list:
+        self.calls.append(table_settings)
+        return [[["", "（単位：千円）", ""], ["売上高", "100", "200"]]]
+
+    def extract_text(self) -> str:
+        return ""
+
+
+class TestTablesCache(unittest.TestCase):
+    """extract_tables キャッシュ — 継続ページ判定と S1 抽出の共有"""
+
+    def test_continuation_check_reused_by_s1(self) -> None:
+        page = _CountingTablePage()
+        cache: dict = {}
+        self.assertTrue(pdf_parser._is_continuation_page(page, 3, tables_cache=cache))
+        s1_settings = pdf_parser.STRATEGIES[0]["settings"]
+        pdf_parser._extract_table_from_page(
+            page, is_header_page=False, table_settings=s1_settings, tables_cache=cache,
+        )
+        self.assertEqual(len(page.calls), 1)
+
+    def test_distinct_settings_extract_separately(self) -> None:
+        page = _CountingTablePage()
+        cache: dict = {}
+        for strategy in pdf_parser.STRATEGIES:
+            pdf_parser._extract_table_from_page(
+                page, is_header_page=False, table_settings=strategy["settings"],
+                tables_cache=cache,
+            )
+        self.assertEqual(len(page.calls), len(pdf_parser.STRATEGIES))
+
+
+class _FullBsPage(_CountingTablePage):
+    """Page whose every strategy yields a complete two-period BS table."""
+
+    def extract_tables(self, table_settings: dict | None = None) -> list:
+        self.calls.append(table_settings)
+        return [[
+            ["", "前連結会計年度\n(2024年３月31日)", "当連結会計年度\n(2025年３月31日)"],
+            ["流動資産合計", "10", "20"],
+            ["固定資産合計", "10", "20"],
+            ["資産合計", "20", "40"],
+            ["流動負債合計", "5", "6"],
+            ["負債合計", "8", "9"],
+            ["純資産合計", "12", "31"],
+        ]]
+
+
+class _ThreePeriodBsPage(_CountingTablePage):
+    """Three-column BS whose period header is only fully read by S2."""
+
+    _HEADERS = [
+        "前々連結会計年度\n(2023年３月31日)",
+        "前連結会計年度\n(2024年３月31日)",
+        "当連結会計年度\n(2025年３月31日)",
+    ]
+
+    def extract_tables(self, table_settings: dict | None = None) -> list:
+        self.calls.append(table_settings)
+        header = list(self._HEADERS)
+        if table_settings == pdf_parser.STRATEGIES[0]["settings"]:
+            header[0] = ""  # S1 loses the first header cell
+        return [[
+            ["", *header],
+            ["流動資産合計", "10", "20", "30"],
+            ["固定資産合計", "10", "20", "30"],
+            ["資産合計", "20", "40", "60"],
+            ["流動負債合計", "5", "6", "7"],
+            ["負債合計", "8", "9", "10"],
+            ["純資産合計", "12", "31", "50"],
+        ]]
+
+
+class TestStrategyEarlyExit(unittest.TestCase):
+    """good-enough 閾値による戦略の早期打ち切り"""
+
+    def test_complete_s1_skips_other_strategies(self) -> None:
+        page = _FullBsPage()
+        result = pdf_parser._try_strategies([page], [True], statement_type="bs")
+        self.assertEqual(len(page.calls), 1)
+        self.assertEqual(result[4], "S1")
+        self.assertEqual(len(result[0]), 2)
+
+    def test_without_statement_type_runs_all(self) -> None:
+        page = _FullBsPage()
+        pdf_parser._try_strategies([page], [True])
+        self.assertEqual(len(page.calls), len(pdf_parser.STRATEGIES))
+
+    def test_more_periods_from_later_strategy_still_win(self) -> None:
+        page = _ThreePeriodBsPage()
+        result = pdf_parser._try_strategies([page], [True], statement_type="bs")
+        self.assertEqual(result[4], "S2")
+        self.assertEqual(len(result[0]), 3)
+
+
+class TestExtractionCache(unittest.TestCase):
+    """PDF_PARSER_CACHE_DIR によるディスクキャッシュ"""
+
+    def _run(self, pdf_path: Path, extract: mock.Mock) -> list:
+        with mock.patch.object(pdf_parser.pdfplumber, "open", mock.MagicMock()), \
+                mock.patch.object(pdf_parser, "_extract_financial_pages", extract):
+            return pdf_parser._extract_statements(pdf_path)
+
+    def test_cache_hit_skips_extraction(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            pdf_path = Path(tmp) / "report.pdf"
+            pdf_path.write_bytes(b"%PDF-1.4 stub")
+            stmt = pdf_parser.ExtractedStatement(
+                statement_type="pl", periods=[], rows=[["売上高", "1", "2"]],
+                pages=[3], unit_multiplier=1000, unit_label="千円",
+            )
+            extract = mock.Mock(return_value=[stmt])
+            with mock.patch.dict(os.environ, {pdf_parser.CACHE_DIR_ENV: str(Path(tmp) / "cache")}):
+                first = self._run(pdf_path, extract)
+                second = self._run(pdf_path, extract)
+                self.assertEqual(extract.call_count, 1)
+                self.assertEqual(second, first)
+
+                pdf_path.write_bytes(b"%PDF-1.4 edited")
+                self._run(pdf_path, extract)
+                self.assertEqual(extract.call_count, 2)
+
+    def test_disabled_without_env(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            pdf_path = Path(tmp) / "report.pdf"
+            pdf_path.write_bytes(b"%PDF-1.4 stub")
+            extract = mock.Mock(return_value=[])
+            with mock.patch.dict(os.environ, {}, clear=False):
+                os.environ.pop(pdf_parser.CACHE_DIR_ENV, None)
+                self._run(pdf_path, extract)
+                self._run(pdf_path, extract)
+            self.assertEqual(extract.call_count, 2)
+
+    def test_bad_entry_falls_back_to_extraction(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            pdf_path = Path(tmp) / "report.pdf"
+            pdf_path.write_bytes(b"%PDF-1.4 stub")
+            cache_dir = Path(tmp) / "cache"
+            extract = mock.Mock(return_value=[])
+            with mock.patch.dict(os.environ, {pdf_parser.CACHE_DIR_ENV: str(cache_dir)}):
+                cache_path = pdf_parser._extraction_cache_path(pdf_path)
+                cache_dir.mkdir()
+                for payload in (b"garbage", pdf_parser.pickle.dumps({"not": "a list"})):
+                    with self.subTest(payload=payload[:8]):
+                        cache_path.write_bytes(payload)
+                        self.assertEqual(self._run(pdf_path, extract), [])
+            self.assertEqual(extract.call_count, 2)
+            self.assertEqual([p.name for p in cache_dir.iterdir()], [cache_path.name])
+
+
 class TestNonOverfitAliases(unittest.TestCase):
     """非2780 合成ゴールデンセット — エイリアス非過適合テスト"""
 
@@ -383,8 +596,13 @@ class TestNonOverfitAliases(unittest.TestCase):
 class TestIntegration2025(unittest.TestCase):
     """2025年PDFでの統合テスト"""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        # PDF 解析は重いのでクラス単位で 1 回だけ実行する
+        cls.doc, cls.meta = pdf_parser.parse_pdf(PDF_2025, "2780")
+
     def test_extracts_5_key_concepts(self) -> None:
-        doc, meta = pdf_parser.parse_pdf(PDF_2025, "2780")
+        doc = self.doc
         self.assertTrue(len(doc.periods) >= 1)
 
         current = max(doc.periods, key=lambda p: p.period_end)
@@ -395,7 +613,7 @@ class TestIntegration2025(unittest.TestCase):
         self.assertIsNotNone(current.cf.get("operating_cf"))
 
     def test_metadata_fields(self) -> None:
-        _, meta = pdf_parser.parse_pdf(PDF_2025, "2780")
+        meta = self.meta
         self.assertEqual(meta.parser_version, pdf_parser.__version__)
         self.assertIn(meta.strategy_used, ["S1", "S2", "S3", "text_fallback"])
         self.assertGreater(meta.concept_score, 0)
@@ -406,9 +624,12 @@ class TestIntegration2025(unittest.TestCase):
 class TestIntegration2019(unittest.TestCase):
     """2019年PDF — fix_1 解消確認（operating_cf 抽出）"""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.doc, cls.meta = pdf_parser.parse_pdf(PDF_2019, "2780")
+
     def test_operating_cf_extracted(self) -> None:
-        doc, meta = pdf_parser.parse_pdf(PDF_2019, "2780")
-        current = max(doc.periods, key=lambda p: p.period_end)
+        current = max(self.doc.periods, key=lambda p: p.period_end)
         self.assertIsNotNone(
             current.cf.get("operating_cf"),
             "2019 operating_cf should not be None after fix_1"
@@ -421,17 +642,19 @@ class TestIntegration2019(unittest.TestCase):
 class TestIntegration2020(unittest.TestCase):
     """2020年PDF — 分断テーブル対応確認"""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.doc, cls.meta = pdf_parser.parse_pdf(PDF_2020, "2780")
+
     def test_total_assets_extracted(self) -> None:
-        doc, _ = pdf_parser.parse_pdf(PDF_2020, "2780")
-        current = max(doc.periods, key=lambda p: p.period_end)
+        current = max(self.doc.periods, key=lambda p: p.period_end)
         self.assertIsNotNone(
             current.bs.get("total_assets"),
             "2020 total_assets should be extractable with multi-strategy + text supplement"
         )
 
     def test_5_key_concepts(self) -> None:
-        doc, _ = pdf_parser.parse_pdf(PDF_2020, "2780")
-        current = max(doc.periods, key=lambda p: p.period_end)
+        current = max(self.doc.periods, key=lambda p: p.period_end)
         self.assertIsNotNone(current.bs.get("total_assets"))
         self.assertIsNotNone(current.pl.get("revenue"))
         self.assertIsNotNone(current.pl.get("operating_income"))
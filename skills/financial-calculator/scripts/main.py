@@ -4,6 +4,8 @@ import argparse
 import json
 import os
 import sys
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -14,20 +16,26 @@ if __name__ == "__main__":
     if str(script_dir) not in sys.path:
         sys.path.insert(0, str(script_dir))
     from metrics import calculate_metrics_payload, write_metrics_payload
-    from report import render_report_markdown
+    from report import write_report_markdown
 else:
     from .metrics import calculate_metrics_payload, write_metrics_payload
-    from .report import render_report_markdown
+    from .report import write_report_markdown
 
 load_dotenv()
 
 
+@lru_cache(maxsize=1)
 def _repo_root() -> Path:
     return Path(__file__).resolve().parents[3]
 
 
 def _resolve_root(env_name: str, fallback_dirname: str) -> Path:
-    configured = os.environ.get(env_name)
+    # 環境変数は毎回読み、解決結果（resolve のファイルシステム走査）だけを値ごとにキャッシュする
+    return _resolve_configured_root(os.environ.get(env_name), fallback_dirname)
+
+
+@lru_cache(maxsize=None)
+def _resolve_configured_root(configured: str | None, fallback_dirname: str) -> Path:
     if not configured:
         return _repo_root() / fallback_dirname
     path = Path(configured).expanduser()
@@ -62,8 +70,10 @@ def report_command(ticker: str, metrics_path: Path, output_path: Path) -> int:
         return 1
 
     try:
-        payload = json.loads(metrics_path.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError) as exc:
+        # bytes のまま渡して json に UTF-8 判定とデコードを任せる。
+        # 不正な UTF-8 (UnicodeDecodeError) も JSONDecodeError も ValueError として扱う
+        payload = json.loads(metrics_path.read_bytes())
+    except (OSError, ValueError) as exc:
         print(f"metrics.json の読み込みに失敗しました: {exc}", file=sys.stderr)
         return 1
 
@@ -71,9 +81,25 @@ def report_command(ticker: str, metrics_path: Path, output_path: Path) -> int:
         print("metrics.json の形式が不正です", file=sys.stderr)
         return 1
 
-    markdown = render_report_markdown(metrics_payload=payload, ticker=ticker)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(markdown, encoding="utf-8")
+    # 同じディレクトリの一時ファイルへ書き出してから置き換え、
+    # 生成途中で失敗しても既存の report.md が途中までの内容で上書きされないようにする
+    with tempfile.NamedTemporaryFile(
+        "w",
+        encoding="utf-8",
+        dir=output_path.parent,
+        prefix=f".{output_path.name}.",
+        suffix=".tmp",
+        delete=False,
+    ) as stream:
+        tmp_path = Path(stream.name)
+        try:
+            write_report_markdown(stream, metrics_payload=payload, ticker=ticker)
+        except BaseException:
+            stream.close()
+            tmp_path.unlink(missing_ok=True)
+            raise
+    os.replace(tmp_path, output_path)
     print(f"レポートを生成しました: {output_path}")
     return 0
 
@@ -116,9 +142,9 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     parser = build_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     data_root = _data_root()
     ticker = str(args.ticker)
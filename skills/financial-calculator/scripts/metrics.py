@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date, datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Mapping, Sequence
+from typing import Iterable, Iterator, Mapping, Sequence
 
+# Below this many input files the thread pool costs more than it saves.
+PARALLEL_LOAD_MIN_FILES = 4
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class FinancialRecord:
     ticker: str
     company_name: str | None
@@ -87,7 +93,10 @@ def calculate_metrics_payload(
 
 def write_metrics_payload(payload: dict[str, object], output_path: Path) -> None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    # Stream into a large write buffer: no full-payload string is built, and
+    # json.dump's many small chunks still reach the disk in few writes.
+    with output_path.open("w", encoding="utf-8", buffering=1 << 16) as file:
+        json.dump(payload, file, ensure_ascii=False, indent=2)
 
 
 def load_financial_records(
@@ -97,45 +106,80 @@ def load_financial_records(
     input_file: Path | None = None,
 ) -> list[FinancialRecord]:
     # Determine which files to read
+    json_paths: list[str | Path]
     if input_file is not None:
-        json_paths = [input_file] if input_file.exists() else []
-    elif parsed_dir is not None and parsed_dir.exists():
-        json_paths = sorted(parsed_dir.glob("*.json"))
+        json_paths = (
+            [input_file] if input_file.exists() and input_file.name != "metrics.json" else []
+        )
+    elif parsed_dir is not None and parsed_dir.is_dir():
+        json_paths = _list_input_json(parsed_dir)
     else:
         return []
 
-    records: list[FinancialRecord] = []
-    for json_path in json_paths:
-        if json_path.name == "metrics.json":
-            continue
-        payload = _load_json(json_path)
+    if len(json_paths) >= PARALLEL_LOAD_MIN_FILES:
+        # File reads overlap across threads; results come back in path order.
+        with ThreadPoolExecutor(max_workers=min(8, len(json_paths))) as executor:
+            payloads = list(executor.map(_load_json, json_paths))
+    else:
+        payloads = [_load_json(path) for path in json_paths]
+
+    # Records are deduplicated as they are produced; duplicates are never listed.
+    records = _deduplicate_records(_iter_records(payloads, ticker))
+    records.sort(key=_record_sort_key)
+    return records
+
+
+_PERIOD_ORDER = {"FY": 0, "Q1": 1, "Q2": 2, "Q3": 3, "Q4": 4}
+# Period ranks stay below 128 (7 bits); the offset keeps shifted years positive.
+_FISCAL_YEAR_OFFSET = 1 << 20
+_NO_FISCAL_YEAR_RANK = 1 << 40
+
+
+def _record_sort_key(record: FinancialRecord) -> tuple[int, str]:
+    """Chronological order: fiscal year, then FY < Q1..Q4 < other, then period_end.
+
+    Year and period rank are folded into one int so most comparisons stop at
+    the first element; records without a fiscal year sort last.
+    """
+    fiscal_year = record.fiscal_year
+    if fiscal_year is None:
+        year_rank = _NO_FISCAL_YEAR_RANK
+    else:
+        year_rank = (fiscal_year + _FISCAL_YEAR_OFFSET) << 7
+    period_rank = _PERIOD_ORDER.get((record.period or "").upper(), 99)
+    return year_rank + period_rank, record.period_end or ""
+
+
+def _list_input_json(parsed_dir: Path) -> list[str]:
+    """Name-sorted ``*.json`` paths in *parsed_dir*, excluding metrics.json."""
+    with os.scandir(parsed_dir) as entries:
+        names = sorted(
+            entry.name
+            for entry in entries
+            if entry.name.endswith(".json") and entry.name != "metrics.json"
+        )
+    return [os.path.join(parsed_dir, name) for name in names]
+
+
+def _iter_records(
+    payloads: Iterable[dict[str, object] | None], ticker: str
+) -> Iterator[FinancialRecord]:
+    for payload in payloads:
         if payload is None:
             continue
         for candidate in _extract_candidates(payload=payload, fallback_ticker=ticker):
             payload_ticker = _as_str(candidate.get("ticker"))
             if payload_ticker and payload_ticker != ticker:
                 continue
-            records.append(_to_financial_record(payload=candidate, fallback_ticker=ticker))
-
-    records = _deduplicate_records(records)
-
-    _PERIOD_ORDER = {"FY": 0, "Q1": 1, "Q2": 2, "Q3": 3, "Q4": 4}
-
-    records.sort(
-        key=lambda record: (
-            record.fiscal_year is None,
-            -1 if record.fiscal_year is None else record.fiscal_year,
-            _PERIOD_ORDER.get((record.period or "").upper(), 99),
-            record.period_end or "",
-        )
-    )
-    return records
+            yield _to_financial_record(payload=candidate, fallback_ticker=ticker)
 
 
-def _load_json(path: Path) -> dict[str, object] | None:
+def _load_json(path: str | Path) -> dict[str, object] | None:
+    # json.loads decodes bytes itself; ValueError also covers undecodable files
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError):
+        with open(path, "rb") as file:
+            payload = json.loads(file.read())
+    except (OSError, ValueError):
         return None
     if isinstance(payload, dict):
         return payload
@@ -143,10 +187,11 @@ def _load_json(path: Path) -> dict[str, object] | None:
 
 
 def _to_financial_record(payload: dict[str, object], fallback_ticker: str) -> FinancialRecord:
-    bs = _as_mapping(payload.get("bs"))
-    pl = _as_mapping(payload.get("pl"))
-    cf = _as_mapping(payload.get("cf"))
-    all_map = _as_mapping(payload)
+    # One normalized view per mapping, shared by all seven _pick_number calls.
+    bs = _NormalizedView(_as_mapping(payload.get("bs")))
+    pl = _NormalizedView(_as_mapping(payload.get("pl")))
+    cf = _NormalizedView(_as_mapping(payload.get("cf")))
+    all_map = _NormalizedView(_as_mapping(payload))
 
     ticker = _as_str(payload.get("ticker")) or fallback_ticker
     company_name = _as_str(payload.get("company_name"))
@@ -155,55 +200,15 @@ def _to_financial_record(payload: dict[str, object], fallback_ticker: str) -> Fi
     period_end = _as_str(payload.get("period_end"))
     period_start = _as_str(payload.get("period_start"))
 
-    revenue = _pick_number(
-        primary=pl,
-        aliases=("revenue", "net_sales", "sales", "売上高", "売上収益"),
-        fallback=all_map,
-    )
+    revenue = _pick_number(primary=pl, aliases=_REVENUE_ALIASES, fallback=all_map)
     operating_income = _pick_number(
-        primary=pl,
-        aliases=("operating_income", "operating_profit", "営業利益"),
-        fallback=all_map,
-    )
-    net_income = _pick_number(
-        primary=pl,
-        aliases=(
-            "net_income",
-            "profit",
-            "profit_attributable_to_owners_of_parent",
-            "親会社株主に帰属する当期純利益",
-            "当期純利益",
-        ),
-        fallback=all_map,
-    )
-    total_assets = _pick_number(
-        primary=bs,
-        aliases=("total_assets", "assets", "資産合計", "総資産"),
-        fallback=all_map,
-    )
-    equity = _pick_number(
-        primary=bs,
-        aliases=("equity", "total_equity", "net_assets", "自己資本", "純資産", "純資産合計"),
-        fallback=all_map,
-    )
-    operating_cf = _pick_number(
-        primary=cf,
-        aliases=(
-            "operating_cf",
-            "cash_flow_from_operating_activities",
-            "営業活動によるキャッシュフロー",
-        ),
-        fallback=all_map,
-    )
-    investing_cf = _pick_number(
-        primary=cf,
-        aliases=(
-            "investing_cf",
-            "cash_flow_from_investing_activities",
-            "投資活動によるキャッシュフロー",
-        ),
-        fallback=all_map,
+        primary=pl, aliases=_OPERATING_INCOME_ALIASES, fallback=all_map
     )
+    net_income = _pick_number(primary=pl, aliases=_NET_INCOME_ALIASES, fallback=all_map)
+    total_assets = _pick_number(primary=bs, aliases=_TOTAL_ASSETS_ALIASES, fallback=all_map)
+    equity = _pick_number(primary=bs, aliases=_EQUITY_ALIASES, fallback=all_map)
+    operating_cf = _pick_number(primary=cf, aliases=_OPERATING_CF_ALIASES, fallback=all_map)
+    investing_cf = _pick_number(primary=cf, aliases=_INVESTING_CF_ALIASES, fallback=all_map)
 
     # Extract metadata fields
     provisional = bool(payload.get("provisional", False))
@@ -235,11 +240,23 @@ def _to_financial_record(payload: dict[str, object], fallback_ticker: str) -> Fi
     )
 
 
-def _build_metrics_series(records: Sequence[FinancialRecord]) -> list[dict[str, object]]:
+_ANNUAL_PERIODS = frozenset({"FY", "MIXED", "DURATION", "INSTANT", "N/A", ""})
+_QUARTERLY_PERIODS = frozenset({"Q1", "Q2", "Q3", "Q4"})
+
+
+def _build_metrics_series(
+    records: Sequence[FinancialRecord],
+) -> tuple[list[dict[str, object]], list[dict[str, object]]]:
     """Build metrics series from records, computing growth rates within same period type."""
-    # Separate annual and quarterly records
-    annual_records = [r for r in records if (r.period or "").upper() in ("FY", "MIXED", "DURATION", "INSTANT", "N/A", "")]
-    quarterly_records = [r for r in records if (r.period or "").upper() in ("Q1", "Q2", "Q3", "Q4")]
+    # Separate annual and quarterly records in one pass
+    annual_records: list[FinancialRecord] = []
+    quarterly_records: list[FinancialRecord] = []
+    for record in records:
+        period = (record.period or "").upper()
+        if period in _ANNUAL_PERIODS:
+            annual_records.append(record)
+        elif period in _QUARTERLY_PERIODS:
+            quarterly_records.append(record)
 
     annual_series = _build_series_for_group(annual_records)
     quarterly_series = _build_quarterly_series(quarterly_records)
@@ -357,45 +374,119 @@ def _build_quarterly_series(records: Sequence[FinancialRecord]) -> list[dict[str
     return series
 
 
+class _NormalizedView:
+    """Mapping keyed by ``_normalize_key``, built on first lookup and reused.
+
+    Only the first source key for each normalized form is kept.
+    """
+
+    __slots__ = ("_mapping", "_view")
+
+    def __init__(self, mapping: Mapping[str, object]) -> None:
+        self._mapping = mapping
+        self._view: dict[str, object] | None = None
+
+    def pick(self, aliases: Sequence[str]) -> float | None:
+        """Return the first numeric value among *aliases* (already normalized)."""
+        view = self._view
+        if view is None:
+            view = {}
+            for key, value in self._mapping.items():
+                view.setdefault(_normalize_key(key), value)
+            self._view = view
+
+        for alias in aliases:
+            numeric = _to_float(view.get(alias))
+            if numeric is not None:
+                return numeric
+        return None
+
+
 def _pick_number(
-    primary: Mapping[str, object], aliases: Sequence[str], fallback: Mapping[str, object]
+    primary: _NormalizedView, aliases: Sequence[str], fallback: _NormalizedView
 ) -> float | None:
-    value = _pick_from_mapping(mapping=primary, aliases=aliases)
+    value = primary.pick(aliases)
     if value is not None:
         return value
-    return _pick_from_mapping(mapping=fallback, aliases=aliases)
-
-
-def _pick_from_mapping(mapping: Mapping[str, object], aliases: Sequence[str]) -> float | None:
-    normalized_map: dict[str, object] = {}
-    for key, value in mapping.items():
-        normalized_key = _normalize_key(key)
-        if normalized_key not in normalized_map:
-            normalized_map[normalized_key] = value
+    return fallback.pick(aliases)
 
-    for alias in aliases:
-        normalized_alias = _normalize_key(alias)
-        matched = normalized_map.get(normalized_alias)
-        numeric = _to_float(matched)
-        if numeric is not None:
-            return numeric
 
-    return None
+# Deletes every non-alphanumeric ASCII character in one C-level pass.
+_ASCII_NON_ALNUM = dict.fromkeys(i for i in range(128) if not chr(i).isalnum())
 
 
+@lru_cache(maxsize=4096)
 def _normalize_key(value: str) -> str:
     lower = value.lower()
+    if lower.isascii():
+        return lower.translate(_ASCII_NON_ALNUM)
     return "".join(ch for ch in lower if ch.isalnum())
 
 
+def _normalized_aliases(*aliases: str) -> tuple[str, ...]:
+    return tuple(_normalize_key(alias) for alias in aliases)
+
+
+# Alias lists for _to_financial_record, normalized once at import time.
+_REVENUE_ALIASES = _normalized_aliases("revenue", "net_sales", "sales", "売上高", "売上収益")
+_OPERATING_INCOME_ALIASES = _normalized_aliases("operating_income", "operating_profit", "営業利益")
+_NET_INCOME_ALIASES = _normalized_aliases(
+    "net_income",
+    "profit",
+    "profit_attributable_to_owners_of_parent",
+    "親会社株主に帰属する当期純利益",
+    "当期純利益",
+)
+_TOTAL_ASSETS_ALIASES = _normalized_aliases("total_assets", "assets", "資産合計", "総資産")
+_EQUITY_ALIASES = _normalized_aliases(
+    "equity", "total_equity", "net_assets", "自己資本", "純資産", "純資産合計"
+)
+_OPERATING_CF_ALIASES = _normalized_aliases(
+    "operating_cf",
+    "cash_flow_from_operating_activities",
+    "営業活動によるキャッシュフロー",
+)
+_INVESTING_CF_ALIASES = _normalized_aliases(
+    "investing_cf",
+    "cash_flow_from_investing_activities",
+    "投資活動によるキャッシュフロー",
+)
+
+
+_NULL_SENTINELS = frozenset({"", "-", "--", "N/A", "n/a", "null", "None"})
+
+
+def _clean_numeric_str(value: str) -> str:
+    """Drop thousands separators and surrounding whitespace.
+
+    Clean strings (the usual XBRL case) are returned as-is without copying.
+    """
+    if "," in value:
+        value = value.replace(",", "")
+    if value[:1].isspace() or value[-1:].isspace():
+        value = value.strip()
+    return value
+
+
+# Keys probed, in order, when a metric is wrapped in a dict.
+_NESTED_VALUE_KEYS = ("value", "amount", "current", "fy")
+
+
 def _to_float(value: object) -> float | None:
-    if isinstance(value, bool):
+    # Exact-type checks first: plain floats/ints (and None) are the bulk of
+    # JSON values. bool is its own type, so it never takes the int branch.
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
+    if value is None or value_type is bool:
         return None
     if isinstance(value, (int, float)):
         return float(value)
     if isinstance(value, str):
-        cleaned = value.replace(",", "").strip()
-        if cleaned in {"", "-", "--", "N/A", "n/a", "null", "None"}:
+        cleaned = _clean_numeric_str(value)
+        if cleaned in _NULL_SENTINELS:
             return None
         try:
             return float(cleaned)
@@ -403,7 +494,7 @@ def _to_float(value: object) -> float | None:
             return None
     if isinstance(value, dict):
         value_mapping = _as_mapping(value)
-        for key in ("value", "amount", "current", "fy"):
+        for key in _NESTED_VALUE_KEYS:
             nested = value_mapping.get(key)
             numeric = _to_float(nested)
             if numeric is not None:
@@ -430,8 +521,8 @@ def _coerce_float(value: object) -> float | None:
     if isinstance(value, int):
         return float(value)
     if isinstance(value, str):
-        cleaned = value.replace(",", "").strip()
-        if cleaned in {"", "-", "--", "N/A", "n/a", "null", "None"}:
+        cleaned = _clean_numeric_str(value)
+        if cleaned in _NULL_SENTINELS:
             return None
         try:
             return float(cleaned)
@@ -451,8 +542,8 @@ def _coerce_int(value: object) -> int | None:
     if isinstance(value, float):
         return int(value)
     if isinstance(value, str):
-        cleaned = value.replace(",", "").strip()
-        if cleaned in {"", "-", "--", "N/A", "n/a", "null", "None"}:
+        cleaned = _clean_numeric_str(value)
+        if cleaned in _NULL_SENTINELS:
             return None
         try:
             return int(float(cleaned))
@@ -482,27 +573,37 @@ def _compute_period_months(period_start: str | None, period_end: str | None) ->
     """
     if not period_start or not period_end:
         return None
-    try:
-        start = date.fromisoformat(period_start)
-        end = date.fromisoformat(period_end)
-    except ValueError:
+    start = _year_month(period_start)
+    end = _year_month(period_end)
+    if start is None or end is None:
         return None
     # Financial periods start on 1st and end on last day of month,
     # so add 1 to include the end month.
-    months = (end.year - start.year) * 12 + (end.month - start.month + 1)
+    months = (end[0] - start[0]) * 12 + (end[1] - start[1] + 1)
     if months <= 0:
         return None
     return months
 
 
+@lru_cache(maxsize=1024)
+def _year_month(iso_date: str) -> tuple[int, int] | None:
+    """(year, month) of a validated ISO date; the same dates recur across documents."""
+    try:
+        parsed = date.fromisoformat(iso_date)
+    except ValueError:
+        return None
+    return parsed.year, parsed.month
+
+
 def _ratio_percent(numerator: float | None, denominator: float | None) -> float | None:
-    if numerator is None or denominator in (None, 0):
+    # ``not denominator`` rejects both None and 0
+    if numerator is None or not denominator:
         return None
     return (numerator / denominator) * 100.0
 
 
 def _growth_percent(current: float | None, previous: float | None) -> float | None:
-    if current is None or previous in (None, 0):
+    if current is None or not previous:
         return None
     return ((current - previous) / abs(previous)) * 100.0
 
@@ -523,20 +624,25 @@ def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
 
+# Containers _extract_candidates reads besides "periods".
+_OTHER_CANDIDATE_KEYS = ("documents", "period_index", "annual", "quarterly")
+
+
 def _extract_candidates(payload: dict[str, object], fallback_ticker: str) -> list[dict[str, object]]:
     candidates: list[dict[str, object]] = []
+    top_ticker = _as_str(payload.get("ticker")) or fallback_ticker
+    top_company = _as_str(payload.get("company_name"))
 
     periods = payload.get("periods")
     if isinstance(periods, list):
         for period in periods:
             if isinstance(period, dict):
                 candidates.append(
-                    _merge_period(
-                        period=period,
-                        ticker=_as_str(payload.get("ticker")) or fallback_ticker,
-                        company_name=_as_str(payload.get("company_name")),
-                    )
+                    _merge_period(period=period, ticker=top_ticker, company_name=top_company)
                 )
+        # Per-document parser output carries only "periods": skip the other probes.
+        if candidates and not any(key in payload for key in _OTHER_CANDIDATE_KEYS):
+            return candidates
 
     documents = payload.get("documents")
     if isinstance(documents, list):
@@ -561,18 +667,12 @@ def _extract_candidates(payload: dict[str, object], fallback_ticker: str) -> lis
         for period in period_index:
             if isinstance(period, dict):
                 candidates.append(
-                    _merge_period(
-                        period=period,
-                        ticker=_as_str(payload.get("ticker")) or fallback_ticker,
-                        company_name=_as_str(payload.get("company_name")),
-                    )
+                    _merge_period(period=period, ticker=top_ticker, company_name=top_company)
                 )
 
     # Handle integrated_financials.json format (annual/quarterly arrays)
     annual = payload.get("annual")
     if isinstance(annual, list):
-        top_ticker = _as_str(payload.get("ticker")) or fallback_ticker
-        top_company = _as_str(payload.get("company_name"))
         for entry in annual:
             if isinstance(entry, dict):
                 merged = dict(entry)
@@ -583,8 +683,6 @@ def _extract_candidates(payload: dict[str, object], fallback_ticker: str) -> lis
 
     quarterly = payload.get("quarterly")
     if isinstance(quarterly, list):
-        top_ticker = _as_str(payload.get("ticker")) or fallback_ticker
-        top_company = _as_str(payload.get("company_name"))
         for entry in quarterly:
             if isinstance(entry, dict):
                 merged = dict(entry)
@@ -614,18 +712,14 @@ _PERIOD_TYPE_PRIORITY: dict[str, int] = {"mixed": 2, "duration": 1, "instant": 0
 
 def _nonnull_financial_count(record: FinancialRecord) -> int:
     """Count non-null financial fields for dedup ranking."""
-    return sum(
-        1
-        for value in (
-            record.revenue,
-            record.operating_income,
-            record.net_income,
-            record.total_assets,
-            record.equity,
-            record.operating_cf,
-            record.investing_cf,
-        )
-        if value is not None
+    return (
+        (record.revenue is not None)
+        + (record.operating_income is not None)
+        + (record.net_income is not None)
+        + (record.total_assets is not None)
+        + (record.equity is not None)
+        + (record.operating_cf is not None)
+        + (record.investing_cf is not None)
     )
 
 
@@ -638,7 +732,7 @@ def _dedup_sort_key(record: FinancialRecord) -> tuple[int, int, str]:
     )
 
 
-def _deduplicate_records(records: list[FinancialRecord]) -> list[FinancialRecord]:
+def _deduplicate_records(records: Iterable[FinancialRecord]) -> list[FinancialRecord]:
     """Deduplicate: remove exact duplicates, then select one representative per fiscal_year.
 
     Selection criteria (higher wins):
@@ -646,9 +740,10 @@ def _deduplicate_records(records: list[FinancialRecord]) -> list[FinancialRecord
       2. period_type priority: mixed > duration > instant
       3. period_end (newer is better)
     """
-    # Phase 1: remove exact duplicates
-    unique: list[FinancialRecord] = []
+    # Single pass: drop exact duplicates and keep a running best per
+    # (fiscal_year, period_group). Ties keep the earlier record, as max() did.
     seen: set[tuple[object, ...]] = set()
+    best: dict[tuple[int | None, str], tuple[tuple[int, int, str], FinancialRecord]] = {}
     for record in records:
         key = (
             record.fiscal_year,
@@ -665,23 +760,19 @@ def _deduplicate_records(records: list[FinancialRecord]) -> list[FinancialRecord
         if key in seen:
             continue
         seen.add(key)
-        unique.append(record)
-
-    # Phase 2: one representative per (fiscal_year, period_group)
-    # Normalize period to group key: FY/Q1/Q2/Q3/Q4 stay as-is,
-    # other values (mixed/duration/instant) group as "FY"
-    def _period_group(record: FinancialRecord) -> str:
-        p = (record.period or "").upper()
-        if p in ("Q1", "Q2", "Q3", "Q4"):
-            return p
-        return "FY"
-
-    groups: dict[tuple[int | None, str], list[FinancialRecord]] = {}
-    for record in unique:
-        key = (record.fiscal_year, _period_group(record))
-        groups.setdefault(key, []).append(record)
-
-    result: list[FinancialRecord] = []
-    for group in groups.values():
-        result.append(max(group, key=_dedup_sort_key))
-    return result
+
+        group_key = (record.fiscal_year, _period_group(record))
+        sort_key = _dedup_sort_key(record)
+        current = best.get(group_key)
+        if current is None or sort_key > current[0]:
+            best[group_key] = (sort_key, record)
+
+    return [record for _, record in best.values()]
+
+
+def _period_group(record: FinancialRecord) -> str:
+    """Dedup group: FY/Q1/Q2/Q3/Q4 stay as-is, mixed/duration/instant group as FY."""
+    p = (record.period or "").upper()
+    if p in ("Q1", "Q2", "Q3", "Q4"):
+        return p
+    return "FY"
@@ -1,9 +1,42 @@
 from __future__ import annotations
 
-from typing import Sequence
+import io
+from operator import itemgetter
+from typing import TextIO
+
+_PROFITABILITY_COLUMNS = ("fiscal_year", "roe_percent", "roa_percent", "operating_margin_percent")
+_GROWTH_COLUMNS = ("fiscal_year", "revenue_growth_yoy_percent", "profit_growth_yoy_percent", "revenue")
+_SAFETY_COLUMNS = ("fiscal_year", "equity_ratio_percent")
+_CASH_FLOW_COLUMNS = ("fiscal_year", "operating_cf", "free_cash_flow")
+_REPORT_COLUMNS = tuple(
+    dict.fromkeys(_PROFITABILITY_COLUMNS + _GROWTH_COLUMNS + _SAFETY_COLUMNS + _CASH_FLOW_COLUMNS)
+)
+_GET_REPORT_VALUES = itemgetter(*_REPORT_COLUMNS)
+_TABLE_HEADER = "| 項目1 | 項目2 | 項目3 | 項目4 |\n|---|---:|---:|---:|"
+
+# 総合評価スコア (0-4) ごとのコメント
+_ASSESSMENT_WEAK = "主要指標が弱く、財務面の慎重なモニタリングが必要です。"
+_ASSESSMENT_FAIR = "一定の収益力はあるものの、継続的な改善余地があります。"
+_ASSESSMENT_GOOD = "収益性・安全性・キャッシュ創出力がバランス良く、財務状態は良好です。"
+_ASSESSMENT_MESSAGES = (
+    _ASSESSMENT_WEAK,
+    _ASSESSMENT_WEAK,
+    _ASSESSMENT_FAIR,
+    _ASSESSMENT_FAIR,
+    _ASSESSMENT_GOOD,
+)
 
 
 def render_report_markdown(metrics_payload: dict[str, object], ticker: str) -> str:
+    buffer = io.StringIO()
+    write_report_markdown(buffer, metrics_payload=metrics_payload, ticker=ticker)
+    return buffer.getvalue()
+
+
+def write_report_markdown(
+    stream: TextIO, metrics_payload: dict[str, object], ticker: str
+) -> None:
+    """Markdown レポートを *stream* に節ごとに書き出す（全文を文字列として保持しない）。"""
     company_name = _as_str(metrics_payload.get("company_name")) or "Unknown"
     generated_at = _as_str(metrics_payload.get("generated_at")) or "N/A"
     source_count = _as_int(metrics_payload.get("source_count")) or 0
@@ -16,70 +49,49 @@ def render_report_markdown(metrics_payload: dict[str, object], ticker: str) -> s
     latest = metrics_payload.get("latest_snapshot")
     latest_snapshot = latest if isinstance(latest, dict) else {}
 
-    lines: list[str] = []
-    lines.append(f"# {ticker} {company_name} 財務分析レポート")
-    lines.append("")
-    lines.append("## 企業概要")
-    lines.append(f"- 銘柄コード: {ticker}")
-    lines.append(f"- 企業名: {company_name}")
-    lines.append(f"- 解析対象期数: {source_count}")
-    lines.append(f"- 生成日時(UTC): {generated_at}")
-    lines.append("")
-    lines.append("## 財務ハイライト")
-    lines.append(_bullet("売上高", latest_snapshot.get("revenue"), "百万円"))
-    lines.append(_bullet("営業利益", latest_snapshot.get("operating_income"), "百万円"))
-    lines.append(_bullet("当期純利益", latest_snapshot.get("net_income"), "百万円"))
-    lines.append(_bullet("ROE", latest_snapshot.get("roe_percent"), "%"))
-    lines.append(_bullet("ROA", latest_snapshot.get("roa_percent"), "%"))
-    lines.append("")
-    lines.append("## 収益性")
-    lines.append(_table_header())
-    for row in metrics_series:
-        lines.append(
-            _table_row(
-                row=row,
-                columns=(
-                    "fiscal_year",
-                    "roe_percent",
-                    "roa_percent",
-                    "operating_margin_percent",
-                ),
-            )
-        )
-    lines.append("")
-    lines.append("## 成長性")
-    lines.append(_table_header())
-    for row in metrics_series:
-        lines.append(
-            _table_row(
-                row=row,
-                columns=(
-                    "fiscal_year",
-                    "revenue_growth_yoy_percent",
-                    "profit_growth_yoy_percent",
-                    "revenue",
-                ),
-            )
-        )
-    lines.append("")
-    lines.append("## 安全性")
-    lines.append(_table_header())
-    for row in metrics_series:
-        lines.append(_table_row(row=row, columns=("fiscal_year", "equity_ratio_percent")))
-    lines.append("")
-    lines.append("## CF分析")
-    lines.append(_table_header())
-    for row in metrics_series:
-        lines.append(_table_row(row=row, columns=("fiscal_year", "operating_cf", "free_cash_flow")))
-    lines.append("")
-    lines.append("## 総合評価")
-    lines.append(_overall_assessment(latest_snapshot))
-    lines.append("")
-    lines.append("## 再現コマンド")
-    lines.append(f"- 指標算出: `python3 skills/financial-calculator/scripts/main.py calculate --ticker {ticker}`")
-    lines.append(f"- レポート生成: `python3 skills/financial-calculator/scripts/main.py report --ticker {ticker}`")
-    lines.append("")
-    return "\n".join(lines)
+    # 各列のセル文字列を1回だけ作り、4つの表で共有する
+    value_rows = [_report_values(row) for row in metrics_series]
+    value_columns = list(zip(*value_rows)) or [()] * len(_REPORT_COLUMNS)
+    cells = {
+        column: [_as_cell(value) for value in values]
+        for column, values in zip(_REPORT_COLUMNS, value_columns)
+    }
+
+    stream.write(f"""# {ticker} {company_name} 財務分析レポート
+
+## 企業概要
+- 銘柄コード: {ticker}
+- 企業名: {company_name}
+- 解析対象期数: {source_count}
+- 生成日時(UTC): {generated_at}
+
+## 財務ハイライト
+{_bullet("売上高", latest_snapshot.get("revenue"), "百万円")}
+{_bullet("営業利益", latest_snapshot.get("operating_income"), "百万円")}
+{_bullet("当期純利益", latest_snapshot.get("net_income"), "百万円")}
+{_bullet("ROE", latest_snapshot.get("roe_percent"), "%")}
+{_bullet("ROA", latest_snapshot.get("roa_percent"), "%")}
+
+""")
+    profitability_rows = _table_rows_4col(*[cells[column] for column in _PROFITABILITY_COLUMNS])
+    stream.write(f"## 収益性\n{_table_section(profitability_rows)}\n\n")
+    growth_rows = _table_rows_4col(*[cells[column] for column in _GROWTH_COLUMNS])
+    stream.write(f"## 成長性\n{_table_section(growth_rows)}\n\n")
+    safety_rows = _table_rows_2col(*[cells[column] for column in _SAFETY_COLUMNS])
+    stream.write(f"## 安全性\n{_table_section(safety_rows)}\n\n")
+    cash_flow_rows = _table_rows_3col(*[cells[column] for column in _CASH_FLOW_COLUMNS])
+    stream.write(f"## CF分析\n{_table_section(cash_flow_rows)}\n\n")
+    stream.write(f"""## 総合評価
+{_overall_assessment(latest_snapshot)}
+
+## 再現コマンド
+- 指標算出: `python3 skills/financial-calculator/scripts/main.py calculate --ticker {ticker}`
+- レポート生成: `python3 skills/financial-calculator/scripts/main.py report --ticker {ticker}`
+""")
+
+
+def _table_section(rows: str) -> str:
+    return f"{_TABLE_HEADER}\n{rows}" if rows else _TABLE_HEADER
 
 
 def _overall_assessment(latest_snapshot: dict[str, object]) -> str:
@@ -91,21 +103,13 @@ def _overall_assessment(latest_snapshot: dict[str, object]) -> str:
     if roe is None or operating_margin is None or equity_ratio is None:
         return "必要データが不足しており、総合評価は保留です。"
 
-    score = 0
-    if roe >= 10.0:
-        score += 1
-    if operating_margin >= 5.0:
-        score += 1
-    if equity_ratio >= 30.0:
-        score += 1
-    if free_cash_flow is not None and free_cash_flow > 0:
-        score += 1
-
-    if score >= 4:
-        return "収益性・安全性・キャッシュ創出力がバランス良く、財務状態は良好です。"
-    if score >= 2:
-        return "一定の収益力はあるものの、継続的な改善余地があります。"
-    return "主要指標が弱く、財務面の慎重なモニタリングが必要です。"
+    score = (
+        (roe >= 10.0)
+        + (operating_margin >= 5.0)
+        + (equity_ratio >= 30.0)
+        + (free_cash_flow is not None and free_cash_flow > 0)
+    )
+    return _ASSESSMENT_MESSAGES[score]
 
 
 def _bullet(label: str, value: object, unit: str) -> str:
@@ -115,18 +119,50 @@ def _bullet(label: str, value: object, unit: str) -> str:
     return f"- {label}: {numeric:.2f}{unit}"
 
 
-def _table_header() -> str:
-    return "| 項目1 | 項目2 | 項目3 | 項目4 |\n|---|---:|---:|---:|"
+def _report_values(row: dict[str, object]) -> tuple[object, ...]:
+    try:
+        return _GET_REPORT_VALUES(row)
+    except KeyError:
+        return tuple(map(row.get, _REPORT_COLUMNS))
+
+
+# 表は常に4列。列数ごとに書式を固定し、不足セルは "-" で埋める
+def _table_rows_2col(first: list[str], second: list[str]) -> str:
+    return "\n".join([f"| {a} | {b} | - | - |" for a, b in zip(first, second)])
+
+
+def _table_rows_3col(first: list[str], second: list[str], third: list[str]) -> str:
+    return "\n".join([f"| {a} | {b} | {c} | - |" for a, b, c in zip(first, second, third)])
+
+
+def _table_rows_4col(
+    first: list[str], second: list[str], third: list[str], fourth: list[str]
+) -> str:
+    return "\n".join(
+        [f"| {a} | {b} | {c} | {d} |" for a, b, c, d in zip(first, second, third, fourth)]
+    )
+
+
+def _format_float_cell(value: float) -> str:
+    return f"{value:.2f}"
+
+
+def _format_missing_cell(_value: object) -> str:
+    return "-"
 
 
-def _table_row(row: dict[str, object], columns: Sequence[str]) -> str:
-    rendered = [_as_cell(row.get(column)) for column in columns]
-    while len(rendered) < 4:
-        rendered.append("-")
-    return f"| {rendered[0]} | {rendered[1]} | {rendered[2]} | {rendered[3]} |"
+# 完全一致する型で変換関数を引く。bool は int のサブクラスだが数値ではないので、
+# _as_float が None を返すのと揃えて欠損 ("-") として表に載せる
+_CELL_FORMATTERS = {float: _format_float_cell, int: str, bool: _format_missing_cell}
+_FLOAT_CONVERTERS = {float: float, int: float}
 
 
 def _as_cell(value: object) -> str:
+    formatter = _CELL_FORMATTERS.get(type(value))
+    if formatter is not None:
+        return formatter(value)
+    if value is None:
+        return "-"
     if isinstance(value, int):
         return str(value)
     if isinstance(value, float):
@@ -137,7 +173,10 @@ def _as_cell(value: object) -> str:
 
 
 def _as_float(value: object) -> float | None:
-    if isinstance(value, bool):
+    converter = _FLOAT_CONVERTERS.get(type(value))
+    if converter is not None:
+        return converter(value)
+    if value is None or isinstance(value, bool):
         return None
     if isinstance(value, (int, float)):
         return float(value)
@@ -1,5 +1,28 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 # skills/financial-calculator をインポート可能にする
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.metrics import calculate_metrics_payload, load_financial_records  # noqa: E402
+from scripts.report import render_report_markdown  # noqa: E402
+
+REAL_DATA_DIR = Path(__file__).resolve().parents[3] / "data" / "7685" / "parsed"
+
+
+# 実データ (7685) の読み込みと指標算出はセッション全体で1回だけ行う
+@pytest.fixture(scope="session")
+def records():
+    return load_financial_records(parsed_dir=REAL_DATA_DIR, ticker="7685")
+
+
+@pytest.fixture(scope="session")
+def metrics_payload():
+    return calculate_metrics_payload(parsed_dir=REAL_DATA_DIR, ticker="7685")
+
+
+@pytest.fixture(scope="session")
+def report_markdown(metrics_payload):
+    return render_report_markdown(metrics_payload=metrics_payload, ticker="7685")
@@ -8,59 +8,60 @@ from __future__ import annotations
 
 import json
 import math
-import subprocess
-import sys
+from collections import Counter
+from itertools import pairwise
 from pathlib import Path
 
 import pytest
 
+from scripts.metrics import calculate_metrics_payload
+
 REPO_ROOT = Path(__file__).resolve().parents[3]
-SKILL_ROOT = Path(__file__).resolve().parents[1]
 DATA_DIR = REPO_ROOT / "data" / "7685" / "parsed"
 FINANCIALS_JSON = DATA_DIR / "financials.json"
-MAIN_SCRIPT = SKILL_ROOT / "scripts" / "main.py"
-
-sys.path.insert(0, str(SKILL_ROOT))
-
-from scripts.metrics import calculate_metrics_payload, load_financial_records  # noqa: E402
-from scripts.report import render_report_markdown  # noqa: E402
 
 pytestmark = pytest.mark.skipif(
     not FINANCIALS_JSON.exists(),
     reason="data/7685/parsed/financials.json not found",
 )
 
-# ── Shared fixtures ──────────────────────────────────────────────
+# Shared fixtures (records / metrics_payload / report_markdown) live in
+# conftest.py at session scope.
 
 
 @pytest.fixture(scope="module")
-def records():
-    return load_financial_records(parsed_dir=DATA_DIR, ticker="7685")
-
-
-@pytest.fixture(scope="module")
-def metrics_payload():
-    return calculate_metrics_payload(parsed_dir=DATA_DIR, ticker="7685")
+def roe_values(metrics_payload):
+    """Non-None ROE values of the annual series, extracted once."""
+    return [
+        e["roe_percent"]
+        for e in metrics_payload["metrics_series"]
+        if e["roe_percent"] is not None
+    ]
 
 
 @pytest.fixture(scope="module")
-def report_markdown(metrics_payload):
-    return render_report_markdown(metrics_payload=metrics_payload, ticker="7685")
+def fiscal_year_counts(metrics_payload):
+    """Occurrences of each non-None fiscal_year in the annual series."""
+    return Counter(
+        e["fiscal_year"]
+        for e in metrics_payload["metrics_series"]
+        if e["fiscal_year"] is not None
+    )
 
 
 # ── calculate: output structure ──────────────────────────────────
 
 
-REQUIRED_TOP_KEYS = {
+REQUIRED_TOP_KEYS = frozenset({
     "ticker",
     "company_name",
     "generated_at",
     "source_count",
     "metrics_series",
     "latest_snapshot",
-}
+})
 
-REQUIRED_SERIES_KEYS = {
+REQUIRED_SERIES_KEYS = frozenset({
     "fiscal_year",
     "period",
     "revenue",
@@ -74,12 +75,14 @@ REQUIRED_SERIES_KEYS = {
     "equity_ratio_percent",
     "operating_cf",
     "free_cash_flow",
-}
+})
 
 
 class TestCalculateStructure:
     def test_top_level_keys(self, metrics_payload):
-        assert REQUIRED_TOP_KEYS <= set(metrics_payload.keys())
+        assert REQUIRED_TOP_KEYS.issubset(metrics_payload), (
+            f"Missing keys: {REQUIRED_TOP_KEYS - metrics_payload.keys()}"
+        )
 
     def test_ticker_matches(self, metrics_payload):
         assert metrics_payload["ticker"] == "7685"
@@ -94,28 +97,36 @@ class TestCalculateStructure:
         assert len(series) > 0
 
     def test_series_entry_keys(self, metrics_payload):
-        for entry in metrics_payload["metrics_series"]:
-            missing = REQUIRED_SERIES_KEYS - set(entry.keys())
-            assert not missing, f"Missing keys: {missing}"
+        bad = next(
+            (
+                (i, REQUIRED_SERIES_KEYS - entry.keys())
+                for i, entry in enumerate(metrics_payload["metrics_series"])
+                if not REQUIRED_SERIES_KEYS.issubset(entry)
+            ),
+            None,
+        )
+        assert bad is None, f"Entry {bad[0]} missing keys: {bad[1]}"
 
     def test_latest_snapshot_has_required_keys(self, metrics_payload):
         snap = metrics_payload["latest_snapshot"]
         assert isinstance(snap, dict)
-        missing = REQUIRED_SERIES_KEYS - set(snap.keys())
-        assert not missing, f"Missing keys in latest_snapshot: {missing}"
+        assert REQUIRED_SERIES_KEYS.issubset(snap), (
+            f"Missing keys in latest_snapshot: {REQUIRED_SERIES_KEYS - snap.keys()}"
+        )
 
     def test_series_sorted_by_fiscal_year(self, metrics_payload):
-        years = [
+        years = (
             e["fiscal_year"]
             for e in metrics_payload["metrics_series"]
             if e["fiscal_year"] is not None
-        ]
-        assert years == sorted(years)
+        )
+        out_of_order = [(a, b) for a, b in pairwise(years) if a > b]
+        assert not out_of_order, f"fiscal_year not ascending: {out_of_order}"
 
 
 # ── calculate: value types ───────────────────────────────────────
 
-NULLABLE_FLOAT_FIELDS = [
+NULLABLE_FLOAT_FIELDS = (
     "revenue",
     "operating_income",
     "net_income",
@@ -127,7 +138,7 @@ NULLABLE_FLOAT_FIELDS = [
     "equity_ratio_percent",
     "operating_cf",
     "free_cash_flow",
-]
+)
 
 
 class TestCalculateTypes:
@@ -153,31 +164,28 @@ class TestCalculateTypes:
 # ── calculate: known value spot-checks ───────────────────────────
 
 
-def _entries_by_fy(metrics_payload, fiscal_year):
-    all_series = list(metrics_payload["metrics_series"])
-    all_series.extend(metrics_payload.get("quarterly_series", []))
-    return [
-        e
-        for e in all_series
-        if e["fiscal_year"] == fiscal_year
-    ]
+@pytest.fixture(scope="module")
+def revenues_by_fy(metrics_payload):
+    """Non-None revenues per fiscal_year across annual and quarterly series."""
+    index: dict[int, set[float]] = {}
+    for series_key in ("metrics_series", "quarterly_series"):
+        for e in metrics_payload.get(series_key, []):
+            if e["revenue"] is not None:
+                index.setdefault(e["fiscal_year"], set()).add(e["revenue"])
+    return index
 
 
 class TestCalculateKnownValues:
-    def test_has_fy2021_revenue(self, metrics_payload):
-        entries = _entries_by_fy(metrics_payload, 2021)
-        revenues = {e["revenue"] for e in entries if e["revenue"] is not None}
-        assert 5_797_577_000.0 in revenues
-
-    def test_has_fy2022_revenue(self, metrics_payload):
-        entries = _entries_by_fy(metrics_payload, 2022)
-        revenues = {e["revenue"] for e in entries if e["revenue"] is not None}
-        assert 6_989_277_000.0 in revenues
-
-    def test_has_fy2025_revenue(self, metrics_payload):
-        entries = _entries_by_fy(metrics_payload, 2025)
-        revenues = {e["revenue"] for e in entries if e["revenue"] is not None}
-        assert 48_013_769_000.0 in revenues
+    @pytest.mark.parametrize(
+        ("fiscal_year", "expected_revenue"),
+        [
+            (2021, 5_797_577_000.0),
+            (2022, 6_989_277_000.0),
+            (2025, 48_013_769_000.0),
+        ],
+    )
+    def test_has_expected_fy_revenue(self, revenues_by_fy, fiscal_year, expected_revenue):
+        assert expected_revenue in revenues_by_fy.get(fiscal_year, set())
 
     def test_latest_snapshot_is_last_series_entry(self, metrics_payload):
         series = metrics_payload["metrics_series"]
@@ -254,24 +262,20 @@ class TestCalculateComputations:
                     f"FY{entry['fiscal_year']}: equity_ratio {eq_ratio}% out of plausible range"
                 )
 
-    def test_roe_at_least_one_non_none(self, metrics_payload):
+    def test_roe_at_least_one_non_none(self, roe_values):
         """7685 data should produce at least one non-None ROE."""
-        roe_values = [e["roe_percent"] for e in metrics_payload["metrics_series"]]
-        non_none = [v for v in roe_values if v is not None]
-        assert len(non_none) > 0, "No non-None ROE found in 7685 data"
+        assert len(roe_values) > 0, "No non-None ROE found in 7685 data"
 
     def test_equity_ratio_at_least_one_non_none(self, metrics_payload):
         """7685 data should produce at least one non-None equity_ratio."""
-        eq_values = [e["equity_ratio_percent"] for e in metrics_payload["metrics_series"]]
-        non_none = [v for v in eq_values if v is not None]
-        assert len(non_none) > 0, "No non-None equity_ratio found in 7685 data"
+        assert any(
+            e["equity_ratio_percent"] is not None for e in metrics_payload["metrics_series"]
+        ), "No non-None equity_ratio found in 7685 data"
 
-    def test_roe_range(self, metrics_payload):
+    def test_roe_range(self, roe_values):
         """ROE should be within a plausible range."""
-        for entry in metrics_payload["metrics_series"]:
-            roe = entry["roe_percent"]
-            if roe is not None:
-                assert -500.0 <= roe <= 500.0, f"ROE {roe}% out of plausible range"
+        for roe in roe_values:
+            assert -500.0 <= roe <= 500.0, f"ROE {roe}% out of plausible range"
 
 
 # ── calculate: total_equity alias ─────────────────────────────────
@@ -363,7 +367,7 @@ class TestCalculateWriteFile:
         ret = calculate_command(ticker="7685", parsed_dir=DATA_DIR, output_path=output)
         assert ret == 0
         assert output.exists()
-        payload = json.loads(output.read_text(encoding="utf-8"))
+        payload = json.loads(output.read_bytes())
         assert payload["ticker"] == "7685"
         assert isinstance(payload["metrics_series"], list)
         assert len(payload["metrics_series"]) > 0
@@ -371,7 +375,7 @@ class TestCalculateWriteFile:
 
 # ── report: output structure ─────────────────────────────────────
 
-EXPECTED_SECTIONS = [
+EXPECTED_SECTIONS = (
     "企業概要",
     "財務ハイライト",
     "収益性",
@@ -380,24 +384,28 @@ EXPECTED_SECTIONS = [
     "CF分析",
     "総合評価",
     "再現コマンド",
-]
+)
+
+
+@pytest.fixture(scope="module")
+def report_lines(report_markdown):
+    return report_markdown.splitlines()
 
 
 class TestReportStructure:
     def test_starts_with_h1(self, report_markdown):
         assert report_markdown.lstrip().startswith("#")
 
-    def test_contains_all_sections(self, report_markdown):
-        for section in EXPECTED_SECTIONS:
-            assert section in report_markdown, f"Missing section: {section}"
+    def test_contains_all_sections(self, report_lines):
+        headings = {ln[3:].strip() for ln in report_lines if ln.startswith("## ")}
+        missing = [section for section in EXPECTED_SECTIONS if section not in headings]
+        assert not missing, f"Missing sections: {missing}"
 
     def test_contains_ticker(self, report_markdown):
         assert "7685" in report_markdown
 
-    def test_contains_markdown_tables(self, report_markdown):
-        lines = report_markdown.split("\n")
-        table_lines = [ln for ln in lines if "|" in ln and "---" not in ln]
-        assert len(table_lines) > 0
+    def test_contains_markdown_tables(self, report_lines):
+        assert any("|" in ln and "---" not in ln for ln in report_lines)
 
     def test_contains_reproduce_commands(self, report_markdown):
         assert "calculate --ticker 7685" in report_markdown
@@ -435,9 +443,6 @@ class TestReportCommand:
         assert ret == 1
 
 
-# ── End-to-end CLI via subprocess ────────────────────────────────
-
-
 # ── calculate: missing-key resilience ─────────────────────────────
 
 
@@ -734,16 +739,13 @@ class TestDeduplicateFiscalYear:
         entry = payload["metrics_series"][0]
         assert entry["revenue"] == 1_000_000.0
 
-    def test_unique_fiscal_years_in_real_data(self, metrics_payload):
+    def test_unique_fiscal_years_in_real_data(self, fiscal_year_counts):
         """After dedup, each fiscal_year appears at most once."""
-        fiscal_years = [e["fiscal_year"] for e in metrics_payload["metrics_series"]]
-        non_none = [fy for fy in fiscal_years if fy is not None]
-        assert len(non_none) == len(set(non_none)), f"Duplicate fiscal_years: {non_none}"
+        duplicates = {fy: n for fy, n in fiscal_year_counts.items() if n > 1}
+        assert not duplicates, f"Duplicate fiscal_years: {duplicates}"
 
     def test_real_data_record_count(self, records):
         """7685 real data: each (fiscal_year, period_group) represented exactly once."""
-        from collections import Counter
-
         def _period_group(r):
             p = (r.period or "").upper()
             return p if p in ("Q1", "Q2", "Q3", "Q4") else "FY"
@@ -977,18 +979,18 @@ class TestExtractCandidatesFallback:
         assert entry["revenue"] == 5_000_000.0
 
 
-# ── End-to-end CLI via subprocess ────────────────────────────────
+# ── End-to-end CLI (argv → main, in-process) ─────────────────────
 
 
 class TestCLIEndToEnd:
     def test_calculate_then_report(self, tmp_path):
+        from scripts.main import main as cli_main
+
         metrics_path = tmp_path / "metrics.json"
         report_path = tmp_path / "report.md"
 
-        calc_result = subprocess.run(
+        calc_ret = cli_main(
             [
-                sys.executable,
-                str(MAIN_SCRIPT),
                 "calculate",
                 "--ticker",
                 "7685",
@@ -996,22 +998,17 @@ class TestCLIEndToEnd:
                 str(DATA_DIR),
                 "--output",
                 str(metrics_path),
-            ],
-            capture_output=True,
-            text=True,
-            timeout=30,
+            ]
         )
-        assert calc_result.returncode == 0, f"stderr: {calc_result.stderr}"
+        assert calc_ret == 0
         assert metrics_path.exists()
 
-        payload = json.loads(metrics_path.read_text(encoding="utf-8"))
+        payload = json.loads(metrics_path.read_bytes())
         assert payload["ticker"] == "7685"
         assert len(payload["metrics_series"]) > 0
 
-        rpt_result = subprocess.run(
+        rpt_ret = cli_main(
             [
-                sys.executable,
-                str(MAIN_SCRIPT),
                 "report",
                 "--ticker",
                 "7685",
@@ -1019,12 +1016,9 @@ class TestCLIEndToEnd:
                 str(metrics_path),
                 "--output",
                 str(report_path),
-            ],
-            capture_output=True,
-            text=True,
-            timeout=30,
+            ]
         )
-        assert rpt_result.returncode == 0, f"stderr: {rpt_result.stderr}"
+        assert rpt_ret == 0
         assert report_path.exists()
 
         content = report_path.read_text(encoding="utf-8")
@@ -0,0 +1,96 @@
+"""main.py のパス解決ヘルパーとコマンド関数のテスト."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from scripts import main
+
+
+def test_data_root_follows_data_path_changes(monkeypatch, tmp_path: Path) -> None:
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+
+    monkeypatch.setenv("DATA_PATH", str(first))
+    assert main._data_root() == first
+
+    # 解決結果はキャッシュされるが、環境変数の変更は反映される
+    monkeypatch.setenv("DATA_PATH", str(second))
+    assert main._data_root() == second
+
+    monkeypatch.delenv("DATA_PATH")
+    assert main._data_root() == main._repo_root() / "data"
+
+
+def test_relative_data_path_resolves_against_repo_root(monkeypatch) -> None:
+    monkeypatch.setenv("DATA_PATH", "custom-data")
+    assert main._data_root() == (main._repo_root() / "custom-data").resolve()
+
+
+def test_report_command_rejects_non_utf8_metrics(tmp_path: Path, capsys) -> None:
+    metrics_path = tmp_path / "metrics.json"
+    metrics_path.write_bytes(b'{"ticker": "\xff"}')
+
+    ret = main.report_command(
+        ticker="9999", metrics_path=metrics_path, output_path=tmp_path / "report.md"
+    )
+
+    assert ret == 1
+    assert "読み込みに失敗" in capsys.readouterr().err
+    assert not (tmp_path / "report.md").exists()
+
+
+def test_report_command_keeps_existing_report_on_failure(
+    monkeypatch, tmp_path: Path
+) -> None:
+    metrics_path = tmp_path / "metrics.json"
+    metrics_path.write_text('{"company_name": "テスト"}', encoding="utf-8")
+    report_path = tmp_path / "report.md"
+    report_path.write_text("# previous\n", encoding="utf-8")
+
+    def _fail_midway(stream, **_: object) -> None:
+        stream.write("# partial")
+        raise RuntimeError("render failed")
+
+    monkeypatch.setattr(main, "write_report_markdown", _fail_midway)
+    with pytest.raises(RuntimeError):
+        main.report_command(ticker="9999", metrics_path=metrics_path, output_path=report_path)
+
+    assert report_path.read_text(encoding="utf-8") == "# previous\n"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["metrics.json", "report.md"]
+
+
+def test_main_runs_calculate_then_report_from_argv(tmp_path: Path, capsys) -> None:
+    parsed_dir = tmp_path / "parsed"
+    parsed_dir.mkdir()
+    (parsed_dir / "financials.json").write_text(
+        json.dumps(
+            {
+                "ticker": "0000",
+                "period_index": [
+                    {
+                        "fiscal_year": 2024,
+                        "period_type": "FY",
+                        "period_end": "2024-03-31",
+                        "pl": {"revenue": 1000.0, "operating_income": 80.0, "net_income": 50.0},
+                        "bs": {"total_assets": 2000.0, "total_equity": 800.0},
+                    }
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+    metrics_path = tmp_path / "metrics.json"
+    report_path = tmp_path / "report.md"
+
+    calc_argv = ["calculate", "--ticker", "0000", "--parsed-dir", str(parsed_dir)]
+    assert main.main([*calc_argv, "--output", str(metrics_path)]) == 0
+    report_argv = ["report", "--ticker", "0000", "--metrics", str(metrics_path)]
+    assert main.main([*report_argv, "--output", str(report_path)]) == 0
+
+    assert json.loads(metrics_path.read_text(encoding="utf-8"))["source_count"] == 1
+    assert "| 2024 | 6.25 | 2.50 | 8.00 |" in report_path.read_text(encoding="utf-8")
+    assert "解析期数: 1" in capsys.readouterr().out
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+
 import pytest
 
 from scripts.metrics import (
@@ -9,6 +11,7 @@ from scripts.metrics import (
     _build_metrics_series,
     _compute_period_months,
     _growth_percent,
+    load_financial_records,
     _ratio_percent,
     _round_num,
     _sum_nullable,
@@ -362,6 +365,10 @@ class TestComputePeriodMonths:
     def test_end_before_start(self):
         assert _compute_period_months("2024-06-01", "2024-03-31") is None
 
+    def test_out_of_range_day_is_invalid(self):
+        """形式が YYYY-MM-DD でも実在しない日付は None."""
+        assert _compute_period_months("2024-02-30", "2024-12-31") is None
+
 
 # ===================================================================
 # period_months in _build_metrics_series
@@ -394,3 +401,111 @@ class TestPeriodMonthsInSeries:
                      "operating_margin_percent", "equity_ratio_percent",
                      "free_cash_flow"):
             assert key in entry
+
+
+# ===================================================================
+# load_financial_records: ファイル読み込み
+# ===================================================================
+
+def _write_period_file(path, fiscal_year: int, revenue: float) -> None:
+    payload = {
+        "ticker": "7685",
+        "company_name": "TestCo",
+        "periods": [
+            {
+                "fiscal_year": fiscal_year,
+                "period_end": f"{fiscal_year}-03-31",
+                "period_type": "duration",
+                "pl": {"revenue": revenue},
+            }
+        ],
+    }
+    path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+
+
+class TestLoadFinancialRecords:
+    def test_skips_undecodable_file(self, tmp_path):
+        """UTF-8 として読めないファイルは他のファイルを巻き込まずスキップ."""
+        _write_period_file(tmp_path / "a.json", 2023, 1000.0)
+        (tmp_path / "b.json").write_bytes(b'{"ticker": "\xff"}')
+
+        records = load_financial_records(parsed_dir=tmp_path, ticker="7685")
+
+        assert [r.fiscal_year for r in records] == [2023]
+        assert records[0].revenue == 1000.0
+
+    def test_reads_utf8_bom_file(self, tmp_path):
+        """バイト列のまま json.loads に渡すため BOM 付き UTF-8 も読める."""
+        path = tmp_path / "bom.json"
+        _write_period_file(path, 2024, 500.0)
+        path.write_bytes(b"\xef\xbb\xbf" + path.read_bytes())
+
+        records = load_financial_records(parsed_dir=tmp_path, ticker="7685")
+
+        assert [r.revenue for r in records] == [500.0]
+
+    def test_overlapping_periods_keep_the_richer_record(self, tmp_path):
+        """同じ (ticker, fiscal_year, period_end) でも値の多い候補が残る.
+
+        訂正報告書などで同一期間が複数ファイルに現れるため、候補の段階で
+        期間キーだけで間引くと情報の多いレコードを落としてしまう。
+        """
+        _write_period_file(tmp_path / "a_original.json", 2024, 1000.0)
+        richer = {
+            "ticker": "7685",
+            "periods": [
+                {
+                    "fiscal_year": 2024,
+                    "period_end": "2024-03-31",
+                    "period_type": "duration",
+                    "pl": {"revenue": 1000.0},
+                    "bs": {"total_assets": 5000.0},
+                }
+            ],
+        }
+        (tmp_path / "b_amended.json").write_text(json.dumps(richer), encoding="utf-8")
+
+        records = load_financial_records(parsed_dir=tmp_path, ticker="7685")
+
+        assert len(records) == 1
+        assert records[0].total_assets == 5000.0
+
+    def test_alias_keys_are_normalized(self, tmp_path):
+        """別名・表記揺れのキーと top-level フォールバックから値を拾う."""
+        payload = {
+            "ticker": "7685",
+            "annual": [
+                {
+                    "fiscal_year": 2024,
+                    "period_end": "2024-03-31",
+                    "売上高": "1,500",
+                    "Operating-Profit": 150,
+                    "Total Assets": 9000,
+                    "純資産合計": 3000,
+                },
+            ],
+        }
+        path = tmp_path / "integrated_financials.json"
+        path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+
+        (record,) = load_financial_records(input_file=path, ticker="7685")
+
+        assert record.revenue == 1500.0
+        assert record.operating_income == 150.0
+        assert record.total_assets == 9000.0
+        assert record.equity == 3000.0
+        assert record.net_income is None
+
+    def test_parallel_load_matches_file_order(self, tmp_path):
+        """スレッド読み込みでもファイル名順の結果になる."""
+        from scripts import metrics
+
+        count = metrics.PARALLEL_LOAD_MIN_FILES + 2
+        for idx in range(count):
+            _write_period_file(tmp_path / f"doc_{idx:02d}.json", 2015 + idx, 100.0 * idx)
+        (tmp_path / "metrics.json").write_text("{}", encoding="utf-8")
+
+        records = load_financial_records(parsed_dir=tmp_path, ticker="7685")
+
+        assert [r.fiscal_year for r in records] == [2015 + idx for idx in range(count)]
+        assert [r.revenue for r in records] == [100.0 * idx for idx in range(count)]
@@ -0,0 +1,103 @@
+"""pytest unit tests for report.py – Markdown レポートの構造."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from scripts.report import render_report_markdown, write_report_markdown
+
+
+def _payload(**overrides: object) -> dict[str, object]:
+    payload: dict[str, object] = {
+        "company_name": "テスト株式会社",
+        "generated_at": "2025-01-01T00:00:00+00:00",
+        "source_count": 2,
+        "metrics_series": [
+            {
+                "fiscal_year": 2023,
+                "roe_percent": 8.0,
+                "roa_percent": 3.0,
+                "operating_margin_percent": 6.5,
+                "revenue": 1000.0,
+                "equity_ratio_percent": 40.0,
+                "operating_cf": 120.0,
+                "free_cash_flow": 70.0,
+            },
+            {
+                "fiscal_year": 2024,
+                "roe_percent": 12.0,
+                "roa_percent": 4.0,
+                "operating_margin_percent": 7.25,
+                "revenue_growth_yoy_percent": 10.0,
+                "profit_growth_yoy_percent": None,
+                "revenue": 1100.0,
+                "equity_ratio_percent": 42.0,
+                "operating_cf": 150.0,
+                "free_cash_flow": 90.0,
+            },
+        ],
+        "latest_snapshot": {
+            "revenue": 1100.0,
+            "operating_income": 79.75,
+            "net_income": 60.0,
+            "roe_percent": 12.0,
+            "roa_percent": 4.0,
+            "operating_margin_percent": 7.25,
+            "equity_ratio_percent": 42.0,
+            "free_cash_flow": 90.0,
+        },
+    }
+    payload.update(overrides)
+    return payload
+
+
+def test_report_sections_and_rows() -> None:
+    markdown = render_report_markdown(_payload(), ticker="7685")
+    lines = markdown.split("\n")
+
+    assert lines[0] == "# 7685 テスト株式会社 財務分析レポート"
+    assert "- 解析対象期数: 2" in lines
+    assert "- 売上高: 1100.00百万円" in lines
+    assert "| 2024 | 12.00 | 4.00 | 7.25 |" in lines
+    assert "| 2024 | 10.00 | - | 1100.00 |" in lines
+    assert "| 2023 | 40.00 | - | - |" in lines
+    assert "| 2023 | 120.00 | 70.00 | - |" in lines
+    assert markdown.endswith("report --ticker 7685`\n")
+
+
+def test_report_without_series_keeps_table_headers() -> None:
+    markdown = render_report_markdown(
+        _payload(metrics_series=None, latest_snapshot=None, company_name="  "),
+        ticker="7685",
+    )
+
+    assert markdown.startswith("# 7685 Unknown 財務分析レポート\n")
+    assert "## 安全性\n| 項目1 | 項目2 | 項目3 | 項目4 |\n|---|---:|---:|---:|\n\n## CF分析" in markdown
+    assert "- ROE: N/A" in markdown
+    assert "必要データが不足しており、総合評価は保留です。" in markdown
+
+
+def test_bool_snapshot_values_are_not_numeric() -> None:
+    snapshot = {"roe_percent": True, "revenue": 1, "net_income": 2.5}
+    markdown = render_report_markdown(_payload(latest_snapshot=snapshot), ticker="7685")
+
+    assert "- ROE: N/A" in markdown
+    assert "- 売上高: 1.00百万円" in markdown
+    assert "- 当期純利益: 2.50百万円" in markdown
+
+
+def test_bool_series_values_render_as_missing_cells() -> None:
+    series = [{"fiscal_year": 2024, "roe_percent": True, "roa_percent": False}]
+    markdown = render_report_markdown(_payload(metrics_series=series), ticker="7685")
+
+    profitability = markdown.split("## 収益性\n", 1)[1].split("\n\n", 1)[0]
+    assert profitability.endswith("\n| 2024 | - | - | - |")
+
+def test_write_report_markdown_streams_same_document(tmp_path: Path) -> None:
+    report_path = tmp_path / "report.md"
+    with report_path.open("w", encoding="utf-8") as stream:
+        write_report_markdown(stream, metrics_payload=_payload(), ticker="7685")
+
+    assert report_path.read_text(encoding="utf-8") == render_report_markdown(
+        _payload(), ticker="7685"
+    )
@@ -55,8 +55,8 @@ def _resolve_company_name(ticker: str, data_root: Path) -> str | None:
             if json_path.name == "metrics.json":
                 continue
             try:
-                payload = json.loads(json_path.read_text(encoding="utf-8"))
-            except (OSError, json.JSONDecodeError):
+                payload = json.loads(json_path.read_bytes())
+            except (OSError, ValueError):
                 continue
             if not isinstance(payload, dict):
                 continue
@@ -80,8 +80,8 @@ def _resolve_company_name(ticker: str, data_root: Path) -> str | None:
         sec_code = f"{ticker}0"
         for doc_json in sorted(edinet_dir.rglob("documents_*.json"), reverse=True):
             try:
-                cache = json.loads(doc_json.read_text(encoding="utf-8"))
-            except (OSError, json.JSONDecodeError):
+                cache = json.loads(doc_json.read_bytes())
+            except (OSError, ValueError):
                 continue
             results = cache.get("results") if isinstance(cache, dict) else None
             if not isinstance(results, list):
@@ -102,8 +102,8 @@ def _load_json(path: Path) -> dict | None:
     if not path.exists():
         return None
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError):
+        data = json.loads(path.read_bytes())
+    except (OSError, ValueError):
         return None
     return data if isinstance(data, dict) else None
 
@@ -184,8 +184,9 @@ def main() -> int:
         return 1
 
     try:
-        payload = json.loads(metrics_path.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError) as exc:
+        # bytes を直接 json に渡す。不正な UTF-8 も JSONDecodeError も ValueError として扱う
+        payload = json.loads(metrics_path.read_bytes())
+    except (OSError, ValueError) as exc:
         print(f"metrics データの読み込みに失敗しました: {exc}", file=sys.stderr)
         return 1
 
@@ -210,13 +211,13 @@ def main() -> int:
     )
     if recon_path.exists():
         try:
-            recon_data = json.loads(recon_path.read_text(encoding="utf-8"))
+            recon_data = json.loads(recon_path.read_bytes())
             if isinstance(recon_data, dict):
                 absence_map = build_absence_map(recon_data)
                 if not absence_map:
                     absence_map = None
                 fy_end_month = infer_fy_end_month(recon_data)
-        except (OSError, json.JSONDecodeError):
+        except (OSError, ValueError):
             pass  # reconciliation is optional; skip on error
 
     # Load valuation data
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import importlib.util
 import json
 import os
 from pathlib import Path
@@ -321,6 +322,28 @@ def test_company_name_present_no_resolution_needed() -> None:
         assert "既存企業名" in md_text
 
 
+def test_resolve_company_name_skips_undecodable_json() -> None:
+    """non-UTF-8 parsed JSON is skipped like any other unreadable file."""
+    # 他スキルの main と衝突しないよう、reporter の main.py をパス指定・固有名で読み込む
+    spec = importlib.util.spec_from_file_location(
+        "financial_reporter_main", Path(__file__).resolve().parents[1] / "scripts" / "main.py"
+    )
+    reporter_main = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(reporter_main)
+    _resolve_company_name = reporter_main._resolve_company_name
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        parsed_dir = tmp_path / "7685" / "parsed"
+        parsed_dir.mkdir(parents=True)
+        (parsed_dir / "a_broken.json").write_bytes(b'{"company_name": "\xff"}')
+        (parsed_dir / "b_valid.json").write_text(
+            json.dumps({"company_name": "有効株式会社"}, ensure_ascii=False), encoding="utf-8"
+        )
+
+        assert _resolve_company_name(ticker="7685", data_root=tmp_path) == "有効株式会社"
+
+
 # ===================================================================
 # Period label / fiscal year display tests
 # ===================================================================